@@ -4,16 +4,63 @@ Example showing how to backtest the delta-neutral strategy using historical data
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from src.utils.config import ConfigManager
 from src.utils.monitoring import TradingLogger, PerformanceMonitor
 from src.strategy.delta_neutral import DeltaNeutralStrategy
 from src.trading.paper_trading import PaperTradingExecutor
 
+_LOG = logging.getLogger(__name__)
+
+# Columns consumed by the strategy and the paper trading executor
+MARKET_DATA_COLUMNS = {
+    'date', 'symbol', 'instrument_type', 'strike', 'expiry', 'underlying_price',
+    'last_price', 'bid_price', 'ask_price', 'volume', 'oi', 'delta'
+}
+
+def _load_one(csv_path: Path, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Load a single CSV file, using a sidecar Parquet cache when it is up to date.
+    
+    Args:
+        csv_path: Path to the CSV file
+        start_date: Start date for backtesting
+        end_date: End date for backtesting
+        
+    Returns:
+        DataFrame with the rows of this file that fall inside the date range
+    """
+    cache_path = csv_path.with_suffix('.parquet')
+    
+    if cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        # Filters let the reader skip data outside the range; with fastparquet
+        # they only prune whole row groups, so the mask below is still applied
+        df = pd.read_parquet(
+            cache_path,
+            filters=[('date', '>=', start_date), ('date', '<=', end_date)]
+        )
+    else:
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda column: column in MARKET_DATA_COLUMNS,
+            parse_dates=['date']
+        )
+        
+        # Cache is best-effort: Parquet support needs pyarrow (or fastparquet)
+        try:
+            df.to_parquet(cache_path, compression='snappy')
+        except Exception as e:
+            _LOG.debug("Skipping Parquet cache for %s: %s", csv_path, e)
+    
+    # Filter by date range before the frames are combined
+    mask = (df['date'] >= start_date) & (df['date'] <= end_date)
+    return df[mask]
+
 def load_historical_data(data_dir: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     """
     Load and prepare historical market data for backtesting.
@@ -24,18 +71,20 @@ def load_historical_data(data_dir: str, start_date: datetime, end_date: datetime
         end_date: End date for backtesting
         
     Returns:
-        DataFrame containing prepared market data
+        DataFrame containing prepared market data, indexed by date
     """
     data_files = []
     data_path = Path(data_dir)
     
-    # Load all CSV files in the directory
-    for file in data_path.glob("*.csv"):
+    # Load all CSV files in the directory; the C parser releases the GIL
+    with ThreadPoolExecutor() as pool:
+        futures = {file: pool.submit(_load_one, file, start_date, end_date) for file in data_path.glob("*.csv")}
+    
+    for file, future in futures.items():
         try:
-            df = pd.read_csv(file)
-            data_files.append(df)
+            data_files.append(future.result())
         except Exception as e:
-            logging.warning(f"Failed to load {file}: {str(e)}")
+            _LOG.warning("Failed to load %s: %s", file, e)
     
     if not data_files:
         raise ValueError("No data files found")
@@ -43,14 +92,10 @@ def load_historical_data(data_dir: str, start_date: datetime, end_date: datetime
     # Combine all data
     data = pd.concat(data_files, ignore_index=True)
     
-    # Convert date columns
-    data['date'] = pd.to_datetime(data['date'])
-    
-    # Filter by date range
-    mask = (data['date'] >= start_date) & (data['date'] <= end_date)
-    data = data[mask]
+    # Index by date so each trading day can be sliced without a full scan
+    data = data.sort_values('date')
     
-    return data
+    return data.set_index('date')
 
 def run_backtest(config_path: str, data_dir: str, start_date: str, end_date: str):
     """
@@ -77,7 +122,7 @@ def run_backtest(config_path: str, data_dir: str, start_date: str, end_date: str
         end = datetime.strptime(end_date, "%Y-%m-%d")
         
         # Load historical data
-        logging.info("Loading historical data...")
+        _LOG.info("Loading historical data...")
         data = load_historical_data(data_dir, start, end)
         
         # Create strategy instance
@@ -87,41 +132,44 @@ def run_backtest(config_path: str, data_dir: str, start_date: str, end_date: str
         executor = PaperTradingExecutor(strategy=strategy)
         
         # Run backtest
-        logging.info("Starting backtest...")
-        current_date = start
-        while current_date <= end:
-            # Get data for current date
-            daily_data = data[data['date'].dt.date == current_date.date()]
-            
-            if daily_data.empty:
-                current_date += timedelta(days=1)
-                continue
+        _LOG.info("Starting backtest...")
+        days = data.index.normalize()
+        trading_days = days.unique()
+        day_groups = data.groupby(days)
+        
+        # Per-day metrics, filled by index and handed to the monitor in one call
+        total_pnl = np.empty(len(trading_days))
+        portfolio_value = np.empty(len(trading_days))
+        total_delta = np.empty(len(trading_days))
+        
+        for i, current_date in enumerate(trading_days):
+            daily_data = day_groups.get_group(current_date)
             
-            # Update market data
-            market_data = daily_data.to_dict('records')
+            # Update market data with each symbol's last quote of the day
+            market_data = daily_data.drop_duplicates('symbol', keep='last').set_index('symbol')
             executor.simulate_market_update(market_data)
             
             # Execute strategy
             executor.monitor_and_execute()
             
             # Record metrics
-            portfolio_data = {
-                'date': current_date,
-                'total_pnl': float(strategy.portfolio.get_total_pnl()),
-                'portfolio_value': sum(float(pos.current_price * pos.quantity) 
-                                    for pos in strategy.portfolio.positions.values()),
-                'total_delta': float(strategy.portfolio.total_delta)
-            }
-            monitor.record_portfolio_update(portfolio_data)
-            
-            current_date += timedelta(days=1)
+            total_pnl[i] = strategy.portfolio.get_total_pnl()
+            portfolio_value[i] = strategy.portfolio.get_portfolio_value()
+            total_delta[i] = strategy.portfolio.total_delta
+        
+        monitor.record_portfolio_bulk(
+            np.asarray(trading_days, dtype='datetime64[D]'),
+            total_pnl,
+            portfolio_value,
+            total_delta
+        )
         
         # Generate and save performance report
         report = monitor.generate_report()
-        logging.info(f"Backtest completed. Performance Report:\n{report}")
+        _LOG.info("Backtest completed. Performance Report:\n%s", report)
         
     except Exception as e:
-        logging.error(f"Error in backtest: {str(e)}", exc_info=True)
+        _LOG.error("Error in backtest: %s", e, exc_info=True)
         raise
 
 if __name__ == "__main__":
@@ -6,7 +6,13 @@ Live trading example for the delta-neutral options strategy.
 import os
 import sys
 import argparse
+import asyncio
 import logging
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from pathlib import Path
 
 import sys
@@ -18,6 +24,8 @@ from utils.monitoring import TradingLogger, PerformanceMonitor
 from strategy.delta_neutral import DeltaNeutralStrategy
 from trading.live_trading import LiveTradingExecutor
 
+_LOG = logging.getLogger(__name__)
+
 def main(config_path: str):
     # Initialize logging
     logger = TradingLogger(log_dir="logs", log_level="INFO")
@@ -36,26 +44,31 @@ def main(config_path: str):
         executor = LiveTradingExecutor(
             strategy=strategy,
             api_key=config.get("zerodha", "api_key"),
-            api_secret=config.get("zerodha", "api_secret")
+            api_secret=config.get("zerodha", "api_secret"),
+            busy_poll_us=config.get("zerodha").get("busy_poll_us", 0),
+            access_token=config.get("zerodha").get("access_token"),
+            watch_symbols=config.get("strategy").get("watch_symbols", [])
         )
         
-        logging.info("Starting live trading...")
+        _LOG.info("Starting live trading...")
         
-        # Start trading execution
-        executor.start()
+        # Start trading execution, on uvloop when it is installed
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(executor.start())
         
     except KeyboardInterrupt:
-        logging.info("Stopping live trading...")
+        _LOG.info("Stopping live trading...")
         
         # Generate and save performance report
         report = monitor.generate_report()
-        logging.info(f"Performance Report:\n{report}")
+        _LOG.info("Performance Report:\n%s", report)
         
         # Disconnect from broker
         executor.disconnect()
         
     except Exception as e:
-        logging.error(f"Error in live trading: {str(e)}", exc_info=True)
+        _LOG.error("Error in live trading: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Paper trading example for the delta-neutral options strategy.
 import os
 import sys
 import argparse
+import asyncio
 import logging
 from pathlib import Path
 
@@ -14,6 +15,8 @@ from src.utils.monitoring import TradingLogger, PerformanceMonitor
 from src.strategy.delta_neutral import DeltaNeutralStrategy
 from src.trading.paper_trading import PaperTradingExecutor
 
+_LOG = logging.getLogger(__name__)
+
 def main(config_path: str, data_path: str = None):
     # Initialize logging
     logger = TradingLogger(log_dir="logs", log_level="INFO")
@@ -34,20 +37,20 @@ def main(config_path: str, data_path: str = None):
             data_path=data_path
         )
         
-        logging.info("Starting paper trading simulation...")
+        _LOG.info("Starting paper trading simulation...")
         
         # Start trading execution
-        executor.start()
+        asyncio.run(executor.start())
         
     except KeyboardInterrupt:
-        logging.info("Stopping paper trading simulation...")
+        _LOG.info("Stopping paper trading simulation...")
         
         # Generate and save performance report
         report = monitor.generate_report()
-        logging.info(f"Performance Report:\n{report}")
+        _LOG.info("Performance Report:\n%s", report)
         
     except Exception as e:
-        logging.error(f"Error in paper trading: {str(e)}", exc_info=True)
+        _LOG.error("Error in paper trading: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -8,13 +8,22 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 import argparse
+import asyncio
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from utils.config import ConfigManager
 from utils.monitoring import TradingLogger, PerformanceMonitor
 from strategy.delta_neutral import DeltaNeutralStrategy
+from strategy.kernels import warmup
 from trading.live_trading import LiveTradingExecutor
 
+_LOG = logging.getLogger(__name__)
+
 def main():
     """Run the live trading strategy."""
     parser = argparse.ArgumentParser(description="Run delta-neutral strategy in live trading mode")
@@ -36,30 +45,38 @@ def main():
         # Create strategy instance
         strategy = DeltaNeutralStrategy(config.config)
         
+        # Compile the portfolio kernels before the first tick arrives
+        warmup()
+        
         # Initialize live trading executor
         executor = LiveTradingExecutor(
             strategy=strategy,
             api_key=config.get("zerodha", "api_key"),
-            api_secret=config.get("zerodha", "api_secret")
+            api_secret=config.get("zerodha", "api_secret"),
+            busy_poll_us=config.get("zerodha").get("busy_poll_us", 0),
+            access_token=config.get("zerodha").get("access_token"),
+            watch_symbols=config.get("strategy").get("watch_symbols", [])
         )
         
-        logging.info("Starting live trading...")
+        _LOG.info("Starting live trading...")
         
-        # Start trading execution
-        executor.start()
+        # Start trading execution, on uvloop when it is installed
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(executor.start())
         
     except KeyboardInterrupt:
-        logging.info("Stopping live trading...")
+        _LOG.info("Stopping live trading...")
         
         # Generate and save performance report
         report = monitor.generate_report()
-        logging.info(f"Performance Report:\n{report}")
+        _LOG.info("Performance Report:\n%s", report)
         
         # Disconnect from broker
         executor.disconnect()
         
     except Exception as e:
-        logging.error(f"Error in live trading: {str(e)}", exc_info=True)
+        _LOG.error("Error in live trading: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -5,11 +5,20 @@ Production runner for the delta-neutral options strategy with proxy and SSL hand
 
 import os
 import sys
+import asyncio
 import logging
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from pathlib import Path
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.request import getproxies
 
 # Suppress SSL warnings
@@ -22,13 +31,24 @@ sys.path.insert(0, str(project_root))
 from src.utils.config import ConfigManager
 from src.utils.monitoring import TradingLogger, PerformanceMonitor
 from src.strategy.delta_neutral import DeltaNeutralStrategy
+from src.strategy.kernels import warmup
 from src.trading.live_trading import LiveTradingExecutor
 
+_LOG = logging.getLogger(__name__)
+
+# Shared HTTP session: keep-alive connection pool with bounded retries
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
 def get_system_proxies():
     """Get system proxy settings."""
     return getproxies()
 
-def test_zerodha_connection(api_key):
+def test_zerodha_connection(api_key, timeout=5):
     """Test connection to Zerodha API."""
     url = "https://api.kite.trade/quote"
     headers = {
@@ -37,51 +57,47 @@ def test_zerodha_connection(api_key):
     }
     
     proxies = get_system_proxies()
-    logging.info(f"Using system proxies: {proxies}")
+    _LOG.info("Using system proxies: %s", proxies)
     
     try:
-        # First try with SSL verification
-        response = requests.get(url, headers=headers, proxies=proxies)
+        response = _session.get(url, headers=headers, proxies=proxies, timeout=timeout)
         return True, None
-    except requests.exceptions.SSLError:
-        try:
-            # Try without SSL verification
-            response = requests.get(url, headers=headers, proxies=proxies, verify=False)
-            return True, "SSL verification disabled"
-        except Exception as e:
-            return False, str(e)
     except Exception as e:
         return False, str(e)
 
 def main():
     # Initialize logging
     logger = TradingLogger(log_dir="logs", log_level="INFO")
-    logging.info("Starting production trading system...")
+    _LOG.info("Starting production trading system...")
     
     try:
         # Load configuration
         config = ConfigManager("config.json")
         api_key = config.get("zerodha", "api_key")
+        timeout = config.get("zerodha").get("request_timeout", 5)
         
-        # Test connection
-        logging.info("Testing connection to Zerodha API...")
-        success, message = test_zerodha_connection(api_key)
+        # Test connection in the background while the strategy is set up
+        _LOG.info("Testing connection to Zerodha API...")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            connection_test = pool.submit(test_zerodha_connection, api_key, timeout)
+            
+            # Initialize monitoring
+            monitor = PerformanceMonitor(output_dir="results")
+            
+            # Get system proxy settings
+            proxies = get_system_proxies()
+            
+            # Create strategy instance
+            strategy = DeltaNeutralStrategy(config.config)
+            
+            # Compile the portfolio kernels before the first tick arrives
+            warmup()
+            
+            success, message = connection_test.result()
         
         if not success:
-            logging.error(f"Failed to connect to Zerodha API: {message}")
+            _LOG.error("Failed to connect to Zerodha API: %s", message)
             return
-            
-        if message:
-            logging.warning(message)
-        
-        # Initialize monitoring
-        monitor = PerformanceMonitor(output_dir="results")
-        
-        # Get system proxy settings
-        proxies = get_system_proxies()
-        
-        # Create strategy instance
-        strategy = DeltaNeutralStrategy(config.config)
         
         # Initialize live trading executor with proxy and SSL settings
         executor = LiveTradingExecutor(
@@ -89,33 +105,39 @@ def main():
             api_key=config.get("zerodha", "api_key"),
             api_secret=config.get("zerodha", "api_secret"),
             proxies=proxies,
-            disable_ssl=True  # Only for testing
+            session=_session,
+            disable_ssl=True,  # Only for testing
+            busy_poll_us=config.get("zerodha").get("busy_poll_us", 0),
+            access_token=config.get("zerodha").get("access_token"),
+            watch_symbols=config.get("strategy").get("watch_symbols", [])
         )
         
-        logging.info("Trading executor initialized successfully")
-        logging.info("Starting strategy execution...")
+        _LOG.info("Trading executor initialized successfully")
+        _LOG.info("Starting strategy execution...")
         
-        # Start trading execution
-        executor.start()
+        # Start trading execution, on uvloop when it is installed
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(executor.start())
         
     except requests.exceptions.SSLError as e:
-        logging.error("SSL Error - Please check corporate proxy settings")
-        logging.error(str(e))
+        _LOG.error("SSL Error - Please check corporate proxy settings")
+        _LOG.error("%s", e)
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Error in trading system: {str(e)}", exc_info=True)
+        _LOG.error("Error in trading system: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         try:
             # Generate and save performance report
             report = monitor.generate_report()
-            logging.info(f"Performance Report:\n{report}")
+            _LOG.info("Performance Report:\n%s", report)
             
             # Disconnect from broker
             if 'executor' in locals():
                 executor.disconnect()
         except Exception as e:
-            logging.error(f"Error during cleanup: {str(e)}")
+            _LOG.error("Error during cleanup: %s", e)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,9 +9,16 @@ setup(
         "pandas>=1.3.0",
         "numpy>=1.20.0",
         "kiteconnect>=4.1.0",
+        "orjson>=3.6.0",
         "python-dotenv>=0.19.0",
         "pytest>=6.2.5",
     ],
+    extras_require={
+        "backtest": ["pyarrow>=6.0.0"],
+        "jit": ["numba>=0.56.0"],
+        "uvloop": ["uvloop>=0.17.0; sys_platform != 'win32'"],
+        "msgpack": ["msgspec>=0.18.0"],
+    },
     author="Vikas",
     description="A delta-neutral options trading strategy implementation",
     keywords="trading, options, delta-neutral, algorithmic-trading",
@@ -1,9 +1,13 @@
-from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
+import numpy as np
+
+from .kernels import EXIT_TARGET, position_sizes, update_and_signal
 from .portfolio import PortfolioManager, Position
+from .signals import Signal
 
 class DeltaNeutralStrategy:
     def __init__(self, config: Dict):
@@ -16,13 +20,67 @@ class DeltaNeutralStrategy:
         self.config = config
         self.portfolio = PortfolioManager(target_delta=config['strategy']['target_delta'])
         self.logger = logging.getLogger(__name__)
+        self._exit_codes = np.zeros(PortfolioManager.INITIAL_CAPACITY, dtype=np.int8)
+        
+        # Snapshot config scalars once; the per-tick methods read these instead
+        trading, strategy = config['trading'], config['strategy']
+        start_time = datetime.strptime(trading['trading_hours']['start'], '%H:%M')
+        end_time = datetime.strptime(trading['trading_hours']['end'], '%H:%M')
+        self._start_minute = start_time.hour * 60 + start_time.minute
+        self._end_minute = end_time.hour * 60 + end_time.minute
+        self._capital = float(trading['capital'])
+        self._target_profit = trading['target_profit_percentage'] / 100.0
+        self._max_loss = trading['max_loss_percentage'] / 100.0
+        self._min_premium = float(strategy['min_premium'])
+        self._max_positions = int(strategy['max_positions'])
+        self._position_sizing = float(strategy['position_sizing'])
+        self._adjustment_threshold = float(strategy['adjustment_threshold'])
+        
+        # Option types an adjustment found no option for; warned about once until one turns up
+        self._unhedgeable = set()
+        
+        # is_trading_time result, valid for the epoch minute it was computed in
+        self._trading_time_minute = -1
+        self._trading_time = False
 
     def is_trading_time(self) -> bool:
-        """Check if current time is within trading hours."""
-        now = datetime.now().time()
-        start_time = datetime.strptime(self.config['trading']['trading_hours']['start'], '%H:%M').time()
-        end_time = datetime.strptime(self.config['trading']['trading_hours']['end'], '%H:%M').time()
-        return start_time <= now <= end_time
+        """
+        Check if current time is within trading hours.
+        
+        Trading hours have minute resolution, so the result is computed at
+        most once per minute; the start and end minutes are both included.
+        """
+        now = time.time()
+        minute = int(now // 60)
+        
+        if minute != self._trading_time_minute:
+            local = time.localtime(now)
+            minute_of_day = local.tm_hour * 60 + local.tm_min
+            self._trading_time = self._start_minute <= minute_of_day <= self._end_minute
+            self._trading_time_minute = minute
+            
+        return self._trading_time
+
+    def next_market_open(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Get the start of the next trading session.
+        
+        Args:
+            now: Reference time (default: current local time)
+            
+        Returns:
+            Today's start time if it is still ahead, else tomorrow's
+        """
+        now = now or datetime.now()
+        market_open = now.replace(
+            hour=self._start_minute // 60,
+            minute=self._start_minute % 60,
+            second=0,
+            microsecond=0
+        )
+        if market_open <= now:
+            market_open += timedelta(days=1)
+        return market_open
 
     def select_options(self, spot_price: float, options_chain: List[Dict]) -> List[Dict]:
         """
@@ -35,29 +93,39 @@ class DeltaNeutralStrategy:
         Returns:
             List of selected options to trade
         """
-        min_premium = self.config['strategy']['min_premium']
-        max_positions = self.config['strategy']['max_positions']
+        per_side = self._max_positions // 2
         
-        # Filter options by minimum premium
-        valid_options = [
-            opt for opt in options_chain 
-            if float(opt['last_price']) >= min_premium
-        ]
+        if not options_chain or per_side <= 0:
+            return []
         
-        # Sort by liquidity (bid-ask spread)
-        valid_options.sort(key=lambda x: abs(float(x['bid_price']) - float(x['ask_price'])))
+        # Column view of the chain: one row per option
+        last_price, bid_price, ask_price, strike = np.array(
+            [(opt['last_price'], opt['bid_price'], opt['ask_price'], opt['strike']) for opt in options_chain],
+            dtype=np.float64
+        ).T
+        instrument_type = np.array([opt['instrument_type'] for opt in options_chain])
         
-        # Select options closest to spot price
-        call_options = [opt for opt in valid_options if opt['instrument_type'] == 'CE']
-        put_options = [opt for opt in valid_options if opt['instrument_type'] == 'PE']
+        # Filter options by minimum premium
+        valid = last_price >= self._min_premium
+        
+        # Liquidity (bid-ask spread) breaks ties in distance from spot price
+        spread = np.abs(bid_price - ask_price)
+        distance = np.abs(strike - spot_price)
         
         selected_options = []
-        for options in [call_options, put_options]:
-            if options:
-                options.sort(key=lambda x: abs(float(x['strike']) - spot_price))
-                selected_options.extend(options[:max_positions//2])
+        for option_type in ('CE', 'PE'):
+            candidates = np.flatnonzero(valid & (instrument_type == option_type))
+            
+            if len(candidates) > per_side:
+                # Keep everything tied with the k-th closest strike so the spread tie-break still applies
+                cutoff = np.partition(distance[candidates], per_side - 1)[per_side - 1]
+                candidates = candidates[distance[candidates] <= cutoff]
+            
+            # Select options closest to spot price
+            order = np.lexsort((spread[candidates], distance[candidates]))[:per_side]
+            selected_options.extend(options_chain[i] for i in candidates[order])
         
-        return selected_options[:max_positions]
+        return selected_options[:self._max_positions]
 
     def calculate_position_size(self, option: Dict) -> int:
         """
@@ -69,17 +137,14 @@ class DeltaNeutralStrategy:
         Returns:
             Number of contracts to trade
         """
-        capital = self.config['trading']['capital']
-        position_sizing = self.config['strategy']['position_sizing']
-        
-        max_risk = capital * (self.config['trading']['max_loss_percentage'] / 100)
+        max_risk = self._capital * self._max_loss
         option_price = float(option['last_price'])
         
         # Calculate max quantity based on risk per trade
         max_quantity = int(max_risk / option_price)
         
         # Apply position sizing factor
-        target_quantity = int(max_quantity * position_sizing)
+        target_quantity = int(max_quantity * self._position_sizing)
         
         # Ensure minimum quantity of 1
         return max(1, target_quantity)
@@ -91,27 +156,121 @@ class DeltaNeutralStrategy:
         Returns:
             Tuple of (needs_adjustment: bool, adjustment_trades: List[dict])
         """
-        threshold = self.config['strategy']['adjustment_threshold']
-        adjustments = self.portfolio.get_adjustment_trades(threshold)
+        adjustments = self.portfolio.get_adjustment_trades(self._adjustment_threshold)
         return bool(adjustments), adjustments
 
+    def get_adjustment_signals(self, adjustments: List[dict],
+                               options_data: Union[List[Dict], Dict[str, Dict]]) -> List[Signal]:
+        """
+        Turn adjustment trades into orders on concrete options.
+        
+        Each adjustment buys the option of its type with the strike closest to
+        the underlying price (tighter bid-ask spread breaks ties), sized so the
+        option's delta covers the adjustment's target delta.
+        
+        Args:
+            adjustments: Adjustment trades from check_adjustment_needed or process_tick
+            options_data: Available options, as a list of option dictionaries or
+                a dictionary of market data keyed by symbol
+            
+        Returns:
+            List of adjustment signals; adjustments with no usable option are skipped
+        """
+        if isinstance(options_data, dict):
+            options_data = [{'symbol': symbol, **data} for symbol, data in options_data.items()]
+            
+        signals = []
+        for adjustment in adjustments:
+            option_type = adjustment['option_type']
+            candidates = [
+                option for option in options_data
+                if option.get('instrument_type') == option_type and option.get('delta')
+            ]
+            if not candidates:
+                if option_type not in self._unhedgeable:
+                    self._unhedgeable.add(option_type)
+                    self.logger.warning("No %s option with a delta available for adjustment", option_type)
+                continue
+            self._unhedgeable.discard(option_type)
+                
+            spot_price = candidates[0].get('underlying_price')
+            option = min(candidates, key=lambda option: (
+                abs(option['strike'] - spot_price) if spot_price is not None else 0,
+                abs(option.get('bid_price', 0) - option.get('ask_price', 0))
+            ))
+            
+            signals.append(Signal(
+                symbol=option['symbol'],
+                action=adjustment['action'],
+                quantity=max(1, round(abs(adjustment['target_delta'] / option['delta']))),
+                reason='delta_adjustment',
+                option_type=option_type,
+                strike_price=option.get('strike'),
+                expiry=option.get('expiry')
+            ))
+            
+        return signals
+
     def update_positions(self, market_data: Dict[str, Dict]) -> None:
         """
         Update current positions with latest market data.
         
+        The update may be partial: positions missing from market_data keep
+        their last price and delta.
+        
         Args:
             market_data: Dictionary of current market prices and greeks
         """
-        for symbol, position in self.portfolio.positions.items():
-            if symbol in market_data:
-                data = market_data[symbol]
-                self.portfolio.update_position(
-                    symbol,
-                    current_price=Decimal(str(data['last_price'])),
-                    delta=Decimal(str(data['delta']))
-                )
+        self._evaluate_positions(market_data)
 
-    def get_entry_signals(self, options_data: List[Dict]) -> List[Dict]:
+    def _evaluate_positions(self, market_data: Optional[Dict[str, Dict]] = None) -> Tuple[np.ndarray, float]:
+        """
+        Run the update/exit kernel over all open positions.
+        
+        Args:
+            market_data: Dictionary of current market prices and greeks (optional)
+            
+        Returns:
+            Tuple of (exit codes per position row, total portfolio delta)
+        """
+        portfolio = self.portfolio
+        n = len(portfolio)
+        
+        rows, prices, deltas = [], [], []
+        if market_data and len(market_data) < n:
+            for symbol, data in market_data.items():
+                i = portfolio.index_of(symbol)
+                if i is not None:
+                    rows.append(i)
+                    prices.append(data['last_price'])
+                    deltas.append(data['delta'])
+        elif market_data:
+            for i, symbol in enumerate(portfolio.symbols):
+                data = market_data.get(symbol)
+                if data is not None:
+                    rows.append(i)
+                    prices.append(data['last_price'])
+                    deltas.append(data['delta'])
+        
+        if len(self._exit_codes) < n:
+            self._exit_codes = np.zeros(len(portfolio.quantity), dtype=np.int8)
+        exit_codes = self._exit_codes[:n]
+        
+        total_delta = update_and_signal(
+            portfolio.current_price[:n],
+            portfolio.entry_price[:n],
+            portfolio.delta[:n],
+            portfolio.quantity[:n],
+            np.array(rows, dtype=np.int64),
+            np.array(prices, dtype=np.float64),
+            np.array(deltas, dtype=np.float64),
+            self._target_profit,
+            self._max_loss,
+            exit_codes
+        )
+        return exit_codes, float(total_delta)
+
+    def get_entry_signals(self, options_data: List[Dict]) -> List[Signal]:
         """
         Generate entry signals for new positions.
         
@@ -122,10 +281,9 @@ class DeltaNeutralStrategy:
             List of entry signals with option details and quantities
         """
         signals = []
-        current_positions = len(self.portfolio.positions)
-        max_positions = self.config['strategy']['max_positions']
+        current_positions = len(self.portfolio)
         
-        if current_positions >= max_positions:
+        if current_positions >= self._max_positions:
             return signals
             
         selected_options = self.select_options(
@@ -133,42 +291,84 @@ class DeltaNeutralStrategy:
             options_chain=options_data
         )
         
-        for option in selected_options:
-            quantity = self.calculate_position_size(option)
-            signals.append({
-                'symbol': option['symbol'],
-                'action': 'BUY',
-                'quantity': quantity,
-                'option_type': option['instrument_type'],
-                'strike_price': option['strike'],
-                'expiry': option['expiry']
-            })
+        if not selected_options:
+            return signals
+            
+        # Size all selected options in one kernel call (same rule as calculate_position_size)
+        quantities = position_sizes(
+            np.array([option['last_price'] for option in selected_options], dtype=np.float64),
+            self._capital * self._max_loss,
+            self._position_sizing
+        )
+        
+        for option, quantity in zip(selected_options, quantities.tolist()):
+            signals.append(Signal(
+                symbol=option['symbol'],
+                action='BUY',
+                quantity=quantity,
+                reason=None,
+                option_type=option['instrument_type'],
+                strike_price=option['strike'],
+                expiry=option['expiry']
+            ))
             
         return signals
 
-    def get_exit_signals(self) -> List[Dict]:
+    def get_exit_signals(self) -> List[Signal]:
         """
         Generate exit signals based on profit targets or stop losses.
         
         Returns:
             List of exit signals for current positions
         """
-        signals = []
-        target_profit = self.config['trading']['target_profit_percentage'] / 100
-        max_loss = self.config['trading']['max_loss_percentage'] / 100
-        
-        for symbol, position in self.portfolio.positions.items():
-            pnl_percentage = float(position.pnl) / (float(position.entry_price) * position.quantity)
-            
-            if pnl_percentage >= target_profit or pnl_percentage <= -max_loss:
-                signals.append({
-                    'symbol': symbol,
-                    'action': 'SELL',
-                    'quantity': position.quantity,
-                    'reason': 'target_hit' if pnl_percentage >= target_profit else 'stop_loss'
-                })
-                
-        return signals
+        exit_codes, _ = self._evaluate_positions()
+        return self._exit_signals(exit_codes)
+
+    def process_tick(self, market_data: Dict[str, Dict]) -> Tuple[List[Signal], List[dict]]:
+        """
+        Update positions and generate exit and adjustment trades in a single pass.
+        
+        Adjustments are sized against the delta left once the exits are filled,
+        so they do not hedge positions that are being closed in the same cycle.
+        
+        Args:
+            market_data: Dictionary of current market prices and greeks
+            
+        Returns:
+            Tuple of (exit_signals, adjustment_trades)
+        """
+        exit_codes, total_delta = self._evaluate_positions(market_data)
+        exiting = np.flatnonzero(exit_codes)
+        if len(exiting):
+            portfolio = self.portfolio
+            total_delta -= float((portfolio.delta[exiting] * portfolio.quantity[exiting]).sum())
+        adjustments = self.portfolio.get_adjustment_trades(self._adjustment_threshold, total_delta)
+        return self._exit_signals(exit_codes), adjustments
+
+    def _exit_signals(self, exit_codes: np.ndarray) -> List[Signal]:
+        """
+        Build exit signals from the kernel's per-position exit codes.
+        
+        Args:
+            exit_codes: EXIT_* code for each position row
+            
+        Returns:
+            List of exit signals for flagged positions
+        """
+        symbols = self.portfolio.symbols
+        
+        return [
+            Signal(
+                symbol=symbols[i],
+                action='SELL',
+                quantity=int(self.portfolio.quantity[i]),
+                reason='target_hit' if exit_codes[i] == EXIT_TARGET else 'stop_loss',
+                option_type=None,
+                strike_price=None,
+                expiry=None
+            )
+            for i in np.flatnonzero(exit_codes)
+        ]
 
     def __str__(self) -> str:
         """String representation of the strategy state."""
@@ -0,0 +1,161 @@
+"""
+Numerical kernels for the per-tick portfolio update, delta adjustment checks,
+entry sizing and paper-trading fills.
+
+Kernels are compiled with Numba when it is installed and run as plain NumPy
+code otherwise, so they are written with array operations that both support.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Exit codes written by update_and_signal
+EXIT_NONE = 0
+EXIT_TARGET = 1
+EXIT_STOP_LOSS = 2
+
+# Adjustment codes returned by check_adjustment
+ADJUST_NONE = 0
+ADJUST_BUY_PE = 1
+ADJUST_BUY_CE = 2
+
+# Kernels are not cached on disk: the cache records the importing module's
+# name, and this module is imported as both src.strategy.kernels and
+# strategy.kernels, so a cache written under one name fails to load under the other.
+
+
+# No fastmath: its no-NaN assumption would let the exit comparisons below
+# misfire on a NaN P&L
+@njit('f8(f8[:], f8[:], f8[:], i8[:], i8[:], f8[:], f8[:], f8, f8, i1[:])')
+def update_and_signal(current_price, entry_price, delta, quantity,
+                      rows, new_prices, new_deltas,
+                      target_profit, max_loss, exit_codes):
+    """
+    Apply a market update to the position arrays and flag positions to exit.
+
+    Args:
+        current_price: Current price of each position (updated in place)
+        entry_price: Entry price of each position
+        delta: Delta of each position (updated in place)
+        quantity: Quantity of each position
+        rows: Rows of the positions that received new market data
+        new_prices: Latest prices for ``rows``
+        new_deltas: Latest deltas for ``rows``
+        target_profit: Profit target as a fraction of position cost
+        max_loss: Stop loss as a fraction of position cost
+        exit_codes: Output array receiving one EXIT_* code per position
+
+    Returns:
+        Total delta of the positions after the update
+    """
+    current_price[rows] = new_prices
+    delta[rows] = new_deltas
+
+    # Positions with no cost (zero quantity or entry price) never trigger an exit
+    cost = entry_price * quantity
+    has_cost = cost != 0
+    pnl_percentage = np.where(
+        has_cost,
+        (current_price - entry_price) * quantity / np.where(has_cost, cost, 1.0),
+        0.0
+    )
+
+    exit_codes[:] = EXIT_NONE
+    exit_codes[pnl_percentage <= -max_loss] = EXIT_STOP_LOSS
+    exit_codes[pnl_percentage >= target_profit] = EXIT_TARGET
+
+    return (delta * quantity).sum()
+
+
+@njit('Tuple((i8, f8))(f8[:], i8[:], f8, f8)')
+def check_adjustment(delta, quantity, target_delta, threshold):
+    """
+    Check whether the portfolio delta has drifted past the threshold.
+
+    Args:
+        delta: Delta of each position
+        quantity: Quantity of each position
+        target_delta: Target portfolio delta
+        threshold: Maximum acceptable deviation from target delta
+
+    Returns:
+        Tuple of (ADJUST_* code, deviation of the total delta from target)
+    """
+    deviation = (delta * quantity).sum() - target_delta
+    if deviation > threshold:
+        return ADJUST_BUY_PE, deviation
+    if deviation < -threshold:
+        return ADJUST_BUY_CE, deviation
+    return ADJUST_NONE, deviation
+
+
+@njit('i8[:](f8[:], f8, f8)')
+def position_sizes(prices, max_risk, position_sizing):
+    """
+    Size entries so that losing max_risk caps each position, with at least one contract.
+
+    Args:
+        prices: Option price of each entry
+        max_risk: Capital at risk per trade
+        position_sizing: Scaling factor applied to the risk-based quantity
+
+    Returns:
+        Number of contracts for each entry
+    """
+    sizes = np.empty(len(prices), dtype=np.int64)
+    for i in range(len(prices)):
+        size = int(int(max_risk / prices[i]) * position_sizing)
+        sizes[i] = size if size > 1 else 1
+    return sizes
+
+
+@njit('i8(i8[:], f8[:], i8, i8, f8)')
+def apply_fill(quantity, entry_price, row, fill_quantity, price):
+    """
+    Apply an order fill to one position row.
+
+    Buys (positive ``fill_quantity``) move the entry price to the
+    quantity-weighted average; sells (negative) only reduce the quantity.
+
+    Args:
+        quantity: Quantity of each position (updated in place)
+        entry_price: Entry price of each position (updated in place)
+        row: Row of the filled position
+        fill_quantity: Signed quantity filled
+        price: Fill price
+
+    Returns:
+        Quantity held after the fill
+    """
+    held = quantity[row]
+    if fill_quantity > 0:
+        entry_price[row] = (entry_price[row] * held + price * fill_quantity) / (held + fill_quantity)
+    quantity[row] = held + fill_quantity
+    return quantity[row]
+
+
+def warmup() -> None:
+    """
+    Compile every kernel ahead of the first tick.
+
+    With an explicit signature the kernel is compiled when this module is
+    imported; calling it once on a one-position portfolio also exercises the
+    compiled machine code so the first real update pays no start-up cost.
+    """
+    one = np.ones(1, dtype=np.float64)
+    update_and_signal(
+        one.copy(), one.copy(), one.copy(), np.ones(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int64), one.copy(), one.copy(),
+        0.01, 0.02, np.zeros(1, dtype=np.int8)
+    )
+    check_adjustment(one.copy(), np.ones(1, dtype=np.int64), 0.0, 0.1)
+    position_sizes(one.copy(), 1.0, 1.0)
+    apply_fill(np.ones(1, dtype=np.int64), one.copy(), 0, 1, 1.0)
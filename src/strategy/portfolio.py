@@ -1,100 +1,226 @@
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Dict, List, Optional
 
+import numpy as np
+
+from .kernels import ADJUST_BUY_CE, ADJUST_BUY_PE, ADJUST_NONE, check_adjustment
+
 @dataclass
 class Position:
+    __slots__ = ('symbol', 'quantity', 'entry_price', 'current_price', 'delta',
+                 'option_type', 'strike_price', 'expiry')
+
     symbol: str
     quantity: int
-    entry_price: Decimal
-    current_price: Decimal
-    delta: Decimal
+    entry_price: float
+    current_price: float
+    delta: float
     option_type: str  # 'CE' or 'PE'
     strike_price: int
     expiry: str
 
     @property
-    def pnl(self) -> Decimal:
+    def pnl(self) -> float:
         """Calculate the current P&L for the position."""
-        return Decimal(str((self.current_price - self.entry_price) * self.quantity))
+        return (self.current_price - self.entry_price) * self.quantity
 
     @property
-    def net_delta(self) -> Decimal:
+    def net_delta(self) -> float:
         """Calculate the net delta contribution of the position."""
         return self.delta * self.quantity
 
 class PortfolioManager:
+    """
+    Portfolio of option positions stored as a structure of arrays.
+
+    Row ``i`` of the ``quantity``, ``entry_price``, ``current_price`` and
+    ``delta`` arrays belongs to ``symbols[i]``; only the first ``len(self)``
+    rows are live. Aggregates are computed as NumPy reductions over those rows.
+    """
+
+    INITIAL_CAPACITY = 64
+
     def __init__(self, target_delta: float = 0.0):
-        self.positions: Dict[str, Position] = {}
-        self.target_delta = Decimal(str(target_delta))
-    
+        self.target_delta = float(target_delta)
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._option_type: List[str] = []
+        self._strike_price: List[int] = []
+        self._expiry: List[str] = []
+        self.quantity = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)
+        self.entry_price = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.current_price = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.delta = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols of all open positions, in row order."""
+        return list(self._symbols)
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """
+        Snapshot of the open positions keyed by symbol.
+
+        The returned Position objects are copies; use update_position to
+        modify the portfolio.
+        """
+        return {symbol: self._position_at(i) for i, symbol in enumerate(self._symbols)}
+
+    def index_of(self, symbol: str) -> Optional[int]:
+        """Get the array row holding a symbol, or None if it is not held."""
+        return self._index.get(symbol)
+
+    def get_position(self, symbol: str) -> Optional[Position]:
+        """Get a snapshot of a single position, or None if it is not held."""
+        i = self._index.get(symbol)
+        return None if i is None else self._position_at(i)
+
+    def _position_at(self, i: int) -> Position:
+        return Position(
+            symbol=self._symbols[i],
+            quantity=int(self.quantity[i]),
+            entry_price=float(self.entry_price[i]),
+            current_price=float(self.current_price[i]),
+            delta=float(self.delta[i]),
+            option_type=self._option_type[i],
+            strike_price=self._strike_price[i],
+            expiry=self._expiry[i]
+        )
+
+    def _grow(self) -> None:
+        """Double the capacity of the position arrays."""
+        capacity = 2 * len(self.quantity)
+        for name in ('quantity', 'entry_price', 'current_price', 'delta'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
     @property
-    def total_delta(self) -> Decimal:
+    def total_delta(self) -> float:
         """Calculate the total delta of the portfolio."""
-        return sum(pos.net_delta for pos in self.positions.values())
+        n = len(self)
+        return float(np.dot(self.delta[:n], self.quantity[:n]))
 
     @property
-    def delta_deviation(self) -> Decimal:
+    def delta_deviation(self) -> float:
         """Calculate how far the current delta is from the target."""
         return self.total_delta - self.target_delta
 
     def add_position(self, position: Position) -> None:
         """Add a new position to the portfolio."""
-        self.positions[position.symbol] = position
+        i = self._index.get(position.symbol)
+        if i is None:
+            i = len(self)
+            if i == len(self.quantity):
+                self._grow()
+            self._index[position.symbol] = i
+            self._symbols.append(position.symbol)
+            self._option_type.append(position.option_type)
+            self._strike_price.append(position.strike_price)
+            self._expiry.append(position.expiry)
+        else:
+            self._option_type[i] = position.option_type
+            self._strike_price[i] = position.strike_price
+            self._expiry[i] = position.expiry
+
+        self.quantity[i] = position.quantity
+        self.entry_price[i] = position.entry_price
+        self.current_price[i] = position.current_price
+        self.delta[i] = position.delta
 
     def remove_position(self, symbol: str) -> None:
         """Remove a position from the portfolio."""
-        if symbol in self.positions:
-            del self.positions[symbol]
+        i = self._index.pop(symbol, None)
+        if i is None:
+            return
+
+        # Move the last row into the freed slot to keep the live rows contiguous
+        last = len(self) - 1
+        if i != last:
+            moved = self._symbols[last]
+            self._index[moved] = i
+            self._symbols[i] = moved
+            self._option_type[i] = self._option_type[last]
+            self._strike_price[i] = self._strike_price[last]
+            self._expiry[i] = self._expiry[last]
+            for column in (self.quantity, self.entry_price, self.current_price, self.delta):
+                column[i] = column[last]
+
+        self._symbols.pop()
+        self._option_type.pop()
+        self._strike_price.pop()
+        self._expiry.pop()
 
     def update_position(self, symbol: str, **kwargs) -> None:
         """Update an existing position's attributes."""
-        if symbol in self.positions:
-            position = self.positions[symbol]
-            for key, value in kwargs.items():
-                if hasattr(position, key):
-                    setattr(position, key, value)
+        i = self._index.get(symbol)
+        if i is None:
+            return
+
+        # Fast path for the per-tick market update
+        if kwargs.keys() == {'current_price', 'delta'}:
+            self.current_price[i] = kwargs['current_price']
+            self.delta[i] = kwargs['delta']
+            return
+
+        for key, value in kwargs.items():
+            if key in ('quantity', 'entry_price', 'current_price', 'delta'):
+                getattr(self, key)[i] = value
+            elif key in ('option_type', 'strike_price', 'expiry'):
+                getattr(self, '_' + key)[i] = value
 
-    def get_adjustment_trades(self, threshold: float = 0.1) -> List[dict]:
+    def get_adjustment_trades(self, threshold: float = 0.1, total_delta: Optional[float] = None) -> List[dict]:
         """
         Calculate required adjustment trades to maintain delta neutrality.
         
         Args:
             threshold: Maximum acceptable deviation from target delta
+            total_delta: Precomputed total delta of the portfolio (optional)
         
         Returns:
             List of suggested trades to adjust the portfolio
         """
-        deviation = float(self.delta_deviation)
-        if abs(deviation) <= threshold:
+        if total_delta is None:
+            n = len(self)
+            code, deviation = check_adjustment(self.delta[:n], self.quantity[:n], self.target_delta, threshold)
+        else:
+            deviation = total_delta - self.target_delta
+            code = (ADJUST_BUY_PE if deviation > threshold
+                    else ADJUST_BUY_CE if deviation < -threshold
+                    else ADJUST_NONE)
+
+        if code == ADJUST_NONE:
             return []
 
-        adjustments = []
-        if deviation > threshold:
-            # Portfolio is too positive delta, need to add negative delta
-            adjustments.append({
-                'action': 'BUY',
-                'option_type': 'PE',
-                'target_delta': -deviation
-            })
-        elif deviation < -threshold:
-            # Portfolio is too negative delta, need to add positive delta
-            adjustments.append({
-                'action': 'BUY',
-                'option_type': 'CE',
-                'target_delta': abs(deviation)
-            })
-
-        return adjustments
-
-    def get_total_pnl(self) -> Decimal:
+        # Too positive delta needs puts (negative delta); too negative needs calls
+        return [{
+            'action': 'BUY',
+            'option_type': 'PE' if code == ADJUST_BUY_PE else 'CE',
+            'target_delta': -float(deviation)
+        }]
+
+    def get_total_pnl(self) -> float:
         """Calculate the total P&L of the portfolio."""
-        return sum(pos.pnl for pos in self.positions.values())
+        n = len(self)
+        return float(np.dot(self.current_price[:n] - self.entry_price[:n], self.quantity[:n]))
+
+    def get_portfolio_value(self) -> float:
+        """Calculate the current market value of the portfolio."""
+        n = len(self)
+        return float(np.dot(self.current_price[:n], self.quantity[:n]))
 
     def __str__(self) -> str:
         """String representation of the portfolio."""
         return (f"Portfolio Summary:\n"
-                f"Total Positions: {len(self.positions)}\n"
+                f"Total Positions: {len(self)}\n"
                 f"Total Delta: {self.total_delta:.2f}\n"
                 f"Target Delta: {self.target_delta:.2f}\n"
                 f"Current P&L: {self.get_total_pnl():.2f}")
\ No newline at end of file
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True)
+class Signal:
+    """Trade signal produced by the strategy."""
+
+    __slots__ = ('symbol', 'action', 'quantity', 'reason', 'option_type',
+                 'strike_price', 'expiry')
+
+    symbol: str
+    action: str  # 'BUY' or 'SELL'
+    quantity: int
+    reason: Optional[str]  # 'target_hit', 'stop_loss' or 'delta_adjustment'
+    option_type: Optional[str]  # 'CE' or 'PE'
+    strike_price: Optional[int]
+    expiry: Optional[str]
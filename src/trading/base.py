@@ -1,13 +1,79 @@
 from typing import Dict, List, Optional
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import asyncio
 import logging
+import threading
+import time
 from datetime import datetime
 
 from strategy.delta_neutral import DeltaNeutralStrategy
+from strategy.signals import Signal
+
+_LOG = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class OrderResult:
+    """Details of a placed order."""
+    
+    __slots__ = ('symbol', 'quantity', 'side', 'order_type', 'status', 'order_id',
+                 'average_price', 'timestamp')
+    
+    symbol: str
+    quantity: int
+    side: str  # 'BUY' or 'SELL'
+    order_type: str
+    status: str
+    order_id: str
+    average_price: float
+    timestamp: datetime
+
+class _TokenBucket:
+    """Thread-safe token bucket limiting how often an action may run."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second's worth of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now; a negative balance is the wait for this caller
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            
+        if wait > 0:
+            time.sleep(wait)
 
 class TradingExecutor(ABC):
     """Abstract base class for trading execution."""
     
+    # Shortest wait, in seconds, between trading-hours checks outside market hours
+    IDLE_INTERVAL = 1.0
+    
+    # Seconds between market data polls for executors without a push feed
+    POLL_INTERVAL = 1.0
+    
+    # Orders execute_trades may have in flight at once (1 places them one by one)
+    MAX_ORDER_WORKERS = 1
+    
+    # Order placements allowed per second (None for no limit)
+    ORDERS_PER_SECOND: Optional[float] = None
+    
     def __init__(self, strategy: DeltaNeutralStrategy):
         """
         Initialize the trading executor.
@@ -16,10 +82,16 @@ class TradingExecutor(ABC):
             strategy: Instance of DeltaNeutralStrategy
         """
         self.strategy = strategy
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOG
+        
+        self._order_pool = (
+            ThreadPoolExecutor(max_workers=self.MAX_ORDER_WORKERS, thread_name_prefix="order")
+            if self.MAX_ORDER_WORKERS > 1 else None
+        )
+        self._order_limiter = _TokenBucket(self.ORDERS_PER_SECOND) if self.ORDERS_PER_SECOND else None
 
     @abstractmethod
-    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> Dict:
+    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> OrderResult:
         """
         Place a new order.
         
@@ -30,7 +102,7 @@ class TradingExecutor(ABC):
             order_type: Order type (default: "MARKET")
             
         Returns:
-            Order details dictionary
+            Order details
         """
         pass
 
@@ -47,6 +119,19 @@ class TradingExecutor(ABC):
         """
         pass
 
+    def get_options_chain(self) -> List[Dict]:
+        """
+        Get the options available for entries and delta adjustments.
+        
+        Each option carries its market data plus 'symbol', 'instrument_type',
+        'strike', 'expiry' and 'underlying_price'. Executors without an option
+        chain source return none, and then neither enter nor adjust.
+        
+        Returns:
+            List of available options with their details
+        """
+        return []
+
     @abstractmethod
     def get_positions(self) -> List[Dict]:
         """
@@ -67,41 +152,71 @@ class TradingExecutor(ABC):
         """
         pass
 
-    def execute_trades(self, signals: List[Dict]) -> List[Dict]:
+    def execute_trades(self, signals: List[Signal]) -> List[OrderResult]:
         """
         Execute a list of trade signals.
         
+        With MAX_ORDER_WORKERS above 1 the orders are placed concurrently, so a
+        multi-leg batch costs about one round trip instead of one per leg.
+        
         Args:
             signals: List of trade signals
             
         Returns:
-            List of executed order details
-        """
-        executed_orders = []
-        
-        for signal in signals:
-            try:
-                order = self.place_order(
-                    symbol=signal['symbol'],
-                    quantity=signal['quantity'],
-                    side=signal['action']
-                )
-                executed_orders.append(order)
-                self.logger.info(f"Executed trade: {signal}")
-            except Exception as e:
-                self.logger.error(f"Failed to execute trade {signal}: {str(e)}")
+            List of executed order details, in signal order
+        """
+        if self._order_pool is None or len(signals) < 2:
+            orders = [self._execute_signal(signal) for signal in signals]
+        else:
+            futures = [self._order_pool.submit(self._execute_signal, signal) for signal in signals]
+            orders = [future.result() for future in futures]
+            
+        return [order for order in orders if order is not None]
+
+    def _execute_signal(self, signal: Signal) -> Optional[OrderResult]:
+        """
+        Place the order for one trade signal, respecting the order rate limit.
+        
+        Args:
+            signal: Trade signal
+            
+        Returns:
+            Executed order details, or None if the order failed
+        """
+        try:
+            if self._order_limiter is not None:
+                self._order_limiter.acquire()
                 
-        return executed_orders
+            order = self.place_order(
+                symbol=signal.symbol,
+                quantity=signal.quantity,
+                side=signal.action
+            )
+            _LOG.info("Executed trade: %s", signal)
+            return order
+        except Exception as e:
+            _LOG.error("Failed to execute trade %s: %s", signal, e)
+            return None
 
-    def update_portfolio(self) -> None:
-        """Update portfolio with current market data."""
+    def _get_portfolio_market_data(self) -> Dict[str, Dict]:
+        """
+        Get current market data for the symbols held in the portfolio.
+        
+        Returns:
+            Dictionary of market data for each held symbol (empty on failure)
+        """
         try:
-            symbols = [pos.symbol for pos in self.strategy.portfolio.positions.values()]
-            if symbols:
-                market_data = self.get_market_data(symbols)
-                self.strategy.update_positions(market_data)
+            symbols = self.strategy.portfolio.symbols
+            return self.get_market_data(symbols) if symbols else {}
         except Exception as e:
-            self.logger.error(f"Failed to update portfolio: {str(e)}")
+            _LOG.error("Failed to update portfolio: %s", e)
+            return {}
+
+    def update_portfolio(self) -> None:
+        """Update portfolio with current market data."""
+        market_data = self._get_portfolio_market_data()
+        if market_data:
+            self.strategy.update_positions(market_data)
 
     def check_and_adjust_portfolio(self) -> None:
         """Check if portfolio needs adjustment and execute necessary trades."""
@@ -109,43 +224,122 @@ class TradingExecutor(ABC):
             needs_adjustment, adjustments = self.strategy.check_adjustment_needed()
             
             if needs_adjustment:
-                self.logger.info("Portfolio adjustment needed")
-                self.execute_trades(adjustments)
+                self._execute_adjustments(self.get_options_chain(), adjustments)
             
         except Exception as e:
-            self.logger.error(f"Failed to adjust portfolio: {str(e)}")
+            _LOG.error("Failed to adjust portfolio: %s", e)
 
     def monitor_and_execute(self) -> None:
         """Main execution loop for monitoring and trading."""
         try:
-            # Update portfolio with current market data
-            self.update_portfolio()
+            # Update portfolio and collect exit and adjustment trades in one pass
+            exit_signals, adjustments = self.strategy.process_tick(
+                self._get_portfolio_market_data()
+            )
             
-            # Check and execute exit signals
-            exit_signals = self.strategy.get_exit_signals()
+            # Execute exit signals
             if exit_signals:
                 self.execute_trades(exit_signals)
             
-            # Check and execute entry signals
-            entry_signals = self.strategy.get_entry_signals(
-                self.get_market_data([])  # Pass relevant options data
+            self._execute_entries_and_adjustments(self.get_options_chain(), adjustments)
+            
+        except Exception as e:
+            _LOG.error("Error in monitor and execute loop: %s", e)
+
+    async def monitor_and_execute_async(self) -> None:
+        """
+        Async variant of monitor_and_execute used by the trading loop.
+        
+        The portfolio market data and option chain requests are independent, so
+        they run concurrently in the default thread pool and a cycle waits for
+        the slower of the two instead of both in turn. Order placement blocks
+        on the broker too, so it also runs in the pool, keeping the event loop
+        free to take in ticks.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            portfolio_data, options_data = await asyncio.gather(
+                loop.run_in_executor(None, self._get_portfolio_market_data),
+                loop.run_in_executor(None, self.get_options_chain),
+                return_exceptions=True
             )
-            if entry_signals:
-                self.execute_trades(entry_signals)
             
-            # Check and adjust portfolio delta
-            self.check_and_adjust_portfolio()
+            if isinstance(portfolio_data, BaseException):
+                _LOG.error("Failed to get portfolio market data, skipping cycle: %s", portfolio_data)
+                return
+            
+            # Update portfolio and collect exit and adjustment trades in one pass
+            exit_signals, adjustments = self.strategy.process_tick(portfolio_data)
+            
+            # Execute exit signals
+            if exit_signals:
+                await loop.run_in_executor(None, self.execute_trades, exit_signals)
+            
+            if isinstance(options_data, BaseException):
+                raise options_data
+            await loop.run_in_executor(None, self._execute_entries_and_adjustments, options_data, adjustments)
+            
+        except Exception as e:
+            _LOG.error("Error in monitor and execute loop: %s", e)
+
+    def _execute_entries_and_adjustments(self, options_data: List[Dict], adjustments: List[Dict]) -> None:
+        """
+        Execute entry signals for the options data, then delta adjustments.
+        
+        Args:
+            options_data: List of available options with their details
+            adjustments: Adjustment trades from the strategy
+        """
+        # Both need options to trade into
+        if not options_data:
+            return
             
+        # Check and execute entry signals; a failure here must not hold back the adjustments
+        try:
+            entry_signals = self.strategy.get_entry_signals(options_data)
+            if entry_signals:
+                self.execute_trades(entry_signals)
         except Exception as e:
-            self.logger.error(f"Error in monitor and execute loop: {str(e)}")
+            _LOG.error("Failed to execute entry signals: %s", e)
+        
+        # Adjust portfolio delta
+        if adjustments:
+            self._execute_adjustments(options_data, adjustments)
+
+    def _execute_adjustments(self, options_data: List[Dict], adjustments: List[Dict]) -> None:
+        """
+        Place delta adjustment trades on options from the chain.
+        
+        Args:
+            options_data: List of available options with their details
+            adjustments: Adjustment trades from the strategy
+        """
+        if not options_data:
+            return
+            
+        _LOG.info("Portfolio adjustment needed")
+        self.execute_trades(self.strategy.get_adjustment_signals(adjustments, options_data))
+
+    async def wait_for_market_update(self) -> None:
+        """
+        Wait until new market data is available.
+        
+        The default polls, waiting POLL_INTERVAL seconds between cycles.
+        Executors with a push feed override this to wait for the next update.
+        """
+        await asyncio.sleep(self.POLL_INTERVAL)
 
-    def start(self) -> None:
+    async def start(self) -> None:
         """Start the trading execution."""
-        self.logger.info("Starting trading execution...")
+        _LOG.info("Starting trading execution...")
         
         while True:
             if not self.strategy.is_trading_time():
-                self.logger.info("Outside trading hours, waiting...")
+                # Sleep straight through to the next session instead of polling
+                next_open = self.strategy.next_market_open()
+                _LOG.info("Outside trading hours, waiting until %s", next_open)
+                await asyncio.sleep(max(self.IDLE_INTERVAL, (next_open - datetime.now()).total_seconds()))
                 continue
                 
-            self.monitor_and_execute()
\ No newline at end of file
+            await self.wait_for_market_update()
+            await self.monitor_and_execute_async()
\ No newline at end of file
@@ -1,15 +1,144 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+import asyncio
+import functools
+import json
 import logging
-from kiteconnect import KiteConnect
-from decimal import Decimal
+import re
+import socket
+import threading
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from kiteconnect import KiteConnect, KiteTicker
+from twisted.internet import reactor
 
-from src.trading.base import TradingExecutor
+from src.trading.base import OrderResult, TradingExecutor
 from strategy.portfolio import Position
 
+_LOG = logging.getLogger(__name__)
+
+# Option symbols in the "<expiry> <strike> <CE|PE>" format, e.g. "BANKNIFTY 35000 CE"
+_OPTION_SYMBOL_RE = re.compile(r"^(?P<expiry>\S+)\s+(?P<strike>\d+)\s+(?P<option_type>CE|PE)$")
+
+# Linux socket option; not every Python build exports the constant
+_SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+def _busy_poll_allowed(busy_poll_us: int) -> bool:
+    """
+    Check whether this process may set SO_BUSY_POLL to busy_poll_us.
+    
+    Values above net.core.busy_read need CAP_NET_ADMIN.
+    
+    Args:
+        busy_poll_us: Busy-poll time in microseconds
+        
+    Returns:
+        True if the option can be set
+    """
+    try:
+        with socket.socket() as sock:
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, busy_poll_us)
+        return True
+    except OSError:
+        return False
+
+def _implied_underlying_price(chain: List[Dict]) -> Optional[float]:
+    """
+    Estimate the underlying price from an option chain by put-call parity.
+    
+    Uses the call/put pair of one strike and expiry whose prices are closest,
+    i.e. the pair nearest the money, where strike + call - put is most reliable.
+    
+    Args:
+        chain: Options with 'instrument_type', 'strike', 'expiry' and 'last_price'
+        
+    Returns:
+        Implied underlying price, or None if the chain has no call/put pair
+    """
+    prices = {}
+    for option in chain:
+        prices.setdefault((option['expiry'], option['strike']), {})[option['instrument_type']] = option['last_price']
+        
+    pairs = [(strike, pair['CE'], pair['PE']) for (_, strike), pair in prices.items() if len(pair) == 2]
+    if not pairs:
+        return None
+        
+    strike, call, put = min(pairs, key=lambda pair: abs(pair[1] - pair[2]))
+    return strike + call - put
+
+@functools.lru_cache(maxsize=1)
+def _read_saved_session(path: str = "access_token.txt") -> Optional[str]:
+    """
+    Read the saved access token once per process.
+    
+    Args:
+        path: Path to the token file
+        
+    Returns:
+        Saved access token or None
+    """
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+class BusyPollHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections busy-poll the socket for replies (Linux only)."""
+    
+    def __init__(self, busy_poll_us: int, **kwargs):
+        """
+        Initialize the adapter.
+        
+        Args:
+            busy_poll_us: Microseconds to busy-poll before sleeping on a read
+            **kwargs: HTTPAdapter arguments
+        """
+        self.busy_poll_us = busy_poll_us
+        super().__init__(**kwargs)
+        
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        # Keep urllib3's defaults (TCP_NODELAY) and add busy polling
+        pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, _SO_BUSY_POLL, self.busy_poll_us)
+        ]
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
 class LiveTradingExecutor(TradingExecutor):
     """Live trading implementation using Zerodha Kite."""
 
-    def __init__(self, strategy, api_key: str, api_secret: str, proxies: dict = None, disable_ssl: bool = False):
+    # File in cache_dir holding today's NFO symbol -> instrument token map
+    INSTRUMENTS_CACHE_FILE = "instruments.json"
+    
+    # Seconds to wait for websocket ticks before polling market data over REST
+    TICK_TIMEOUT = 5.0
+    
+    # Place multi-leg batches concurrently, within Zerodha's order rate limit
+    MAX_ORDER_WORKERS = 8
+    ORDERS_PER_SECOND = 10
+    
+    # Static part of every order request for each (side, order type), built
+    # once; place_order only adds the symbol and quantity
+    _ORDER_PARAMS = {
+        (side, order_type): {
+            'variety': KiteConnect.VARIETY_REGULAR,
+            'exchange': KiteConnect.EXCHANGE_NFO,
+            'transaction_type': transaction_type,
+            'order_type': kite_order_type,
+            'product': KiteConnect.PRODUCT_NRML
+        }
+        for side, transaction_type in (("BUY", KiteConnect.TRANSACTION_TYPE_BUY),
+                                       ("SELL", KiteConnect.TRANSACTION_TYPE_SELL))
+        for order_type, kite_order_type in (("MARKET", KiteConnect.ORDER_TYPE_MARKET),
+                                            ("LIMIT", KiteConnect.ORDER_TYPE_LIMIT))
+    }
+
+    def __init__(self, strategy, api_key: str, api_secret: str, proxies: dict = None,
+                 session: requests.Session = None, disable_ssl: bool = False,
+                 busy_poll_us: int = 0, access_token: Optional[str] = None,
+                 watch_symbols: Optional[List[str]] = None, cache_dir: Optional[str] = None):
         """
         Initialize live trading executor.
         
@@ -18,13 +147,45 @@ class LiveTradingExecutor(TradingExecutor):
             api_key: Zerodha API key
             api_secret: Zerodha API secret
             proxies: Dictionary of proxy settings (optional)
+            session: HTTP session to reuse for Kite REST calls (optional)
             disable_ssl: Whether to disable SSL verification (use with caution)
+            busy_poll_us: SO_BUSY_POLL time for Kite sockets in microseconds; trades
+                CPU for lower read latency (default: 0, disabled)
+            access_token: Access token, e.g. zerodha.access_token from the config
+                (optional; falls back to access_token.txt)
+            watch_symbols: Option chain symbols to stream and trade entries and
+                delta adjustments in, on top of the held positions (optional)
+            cache_dir: Directory to keep the daily instrument list in across restarts
+                (optional; by default it is only cached in memory)
         """
         super().__init__(strategy)
         
         # Configure Kite Connect with proxy and SSL settings
         self.kite = KiteConnect(api_key=api_key)
         
+        # Reuse the caller's pooled session so REST calls share keep-alive connections;
+        # otherwise size Kite's own pool for concurrent order placement
+        if session is not None:
+            self.kite.reqsession = session
+        else:
+            self.kite.reqsession.mount('https://', HTTPAdapter(
+                pool_connections=2 * self.MAX_ORDER_WORKERS,
+                pool_maxsize=2 * self.MAX_ORDER_WORKERS
+            ))
+            
+        # Busy-poll REST and websocket sockets instead of sleeping on them
+        if busy_poll_us and not _busy_poll_allowed(busy_poll_us):
+            _LOG.warning("SO_BUSY_POLL not permitted (needs CAP_NET_ADMIN or net.core.busy_read); leaving sockets unchanged")
+            busy_poll_us = 0
+        self.busy_poll_us = busy_poll_us
+        if busy_poll_us:
+            self.kite.reqsession.mount('https://', BusyPollHTTPAdapter(
+                busy_poll_us,
+                pool_connections=2 * self.MAX_ORDER_WORKERS,
+                pool_maxsize=2 * self.MAX_ORDER_WORKERS,
+                max_retries=self.kite.reqsession.get_adapter('https://').max_retries
+            ))
+        
         # Configure proxy settings if provided
         if proxies:
             self.kite.set_proxies(proxies)
@@ -32,8 +193,6 @@ class LiveTradingExecutor(TradingExecutor):
         # Handle SSL verification
         if disable_ssl:
             import ssl
-            import requests
-            from requests.adapters import HTTPAdapter
             from urllib3.poolmanager import PoolManager
             
             class TLSAdapter(HTTPAdapter):
@@ -52,7 +211,31 @@ class LiveTradingExecutor(TradingExecutor):
             self.kite.session = session
             
         self.api_secret = api_secret
-        self.logger = logging.getLogger(__name__)
+        self._access_token = access_token
+        
+        # Market data pushed by the Kite websocket, keyed by instrument token
+        self.ticker = None
+        self._loop = None
+        self._tick_queue = None
+        self._quotes: Dict[int, Dict] = {}
+        self._token_symbols: Dict[int, str] = {}
+        self.watch_symbols = list(watch_symbols or [])
+        
+        # Set when the last wait timed out without ticks; market data is then polled over REST
+        self._poll_rest = False
+        
+        # Tokens ticked since the portfolio last consumed market data
+        self._dirty_tokens = set()
+        
+        # NFO symbol -> instrument token map, refreshed once per day, plus the
+        # type, strike and expiry of each watched option; the lock keeps
+        # concurrent first lookups from each downloading the list
+        self._instrument_cache: Dict[str, int] = {}
+        self._option_details: Dict[str, Dict] = {}
+        self._instrument_cache_date: Optional[date] = None
+        self._instrument_lock = threading.Lock()
+        self._instrument_cache_path = Path(cache_dir) / self.INSTRUMENTS_CACHE_FILE if cache_dir else None
+        
         self._initialize_session()
 
     def _initialize_session(self) -> None:
@@ -62,34 +245,33 @@ class LiveTradingExecutor(TradingExecutor):
             access_token = self._get_saved_session()
             
             if not access_token:
-                self.logger.info("No saved session found. Please authenticate.")
+                _LOG.info("No saved session found. Please authenticate.")
                 # Implementation of authentication flow goes here
                 return
                 
             self.kite.set_access_token(access_token)
-            self.logger.info("Successfully initialized trading session")
+            _LOG.info("Successfully initialized trading session")
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize trading session: {str(e)}")
+            _LOG.error("Failed to initialize trading session: %s", e)
             raise
 
-    def _get_saved_session(self) -> str:
+    def _get_saved_session(self) -> Optional[str]:
         """
         Get saved session token if available.
         
         Returns:
             Saved access token or None
         """
-        try:
-            with open("access_token.txt", "r") as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            return None
+        return self._access_token or _read_saved_session()
 
-    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> Dict:
+    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> OrderResult:
         """
         Place a live order through Zerodha.
         
+        The order's fills are not polled for: its final status and average
+        price arrive through the websocket in _handle_order_update.
+        
         Args:
             symbol: Trading symbol
             quantity: Order quantity
@@ -100,39 +282,37 @@ class LiveTradingExecutor(TradingExecutor):
             Order details
         """
         try:
-            transaction_type = self.kite.TRANSACTION_TYPE_BUY if side == "BUY" else self.kite.TRANSACTION_TYPE_SELL
+            # Any side other than BUY sells and any order type other than MARKET is LIMIT
+            params = self._ORDER_PARAMS[
+                "BUY" if side == "BUY" else "SELL",
+                "MARKET" if order_type == "MARKET" else "LIMIT"
+            ]
+            order_id = self.kite.place_order(tradingsymbol=symbol, quantity=quantity, **params)
             
-            order_id = self.kite.place_order(
-                tradingsymbol=symbol,
-                exchange=self.kite.EXCHANGE_NFO,
-                transaction_type=transaction_type,
+            _LOG.info("Placed order: %s", order_id)
+            
+            return OrderResult(
+                symbol=symbol,
                 quantity=quantity,
-                order_type=self.kite.ORDER_TYPE_MARKET if order_type == "MARKET" else self.kite.ORDER_TYPE_LIMIT,
-                product=self.kite.PRODUCT_NRML
+                side=side,
+                order_type=order_type,
+                status='SUBMITTED',
+                order_id=order_id,
+                average_price=0.0,
+                timestamp=datetime.now()
             )
             
-            # Get order details
-            order = self.kite.order_history(order_id)[-1]
-            self.logger.info(f"Placed order: {order_id}")
-            
-            return {
-                'symbol': symbol,
-                'quantity': quantity,
-                'side': side,
-                'type': order_type,
-                'status': order['status'],
-                'order_id': order_id,
-                'average_price': order.get('average_price', 0)
-            }
-            
         except Exception as e:
-            self.logger.error(f"Failed to place order: {str(e)}")
+            _LOG.error("Failed to place order: %s", e)
             raise
 
     def get_market_data(self, symbols: List[str]) -> Dict[str, Dict]:
         """
         Get live market data from Zerodha.
         
+        Symbols streamed over the websocket are served from the latest tick;
+        any others are fetched with a REST quote.
+        
         Args:
             symbols: List of trading symbols
             
@@ -141,31 +321,319 @@ class LiveTradingExecutor(TradingExecutor):
         """
         try:
             # Get instrument tokens for the symbols
-            instruments = {
-                instrument['tradingsymbol']: instrument['instrument_token']
-                for instrument in self.kite.instruments()
-                if instrument['tradingsymbol'] in symbols
+            tokens = self._get_instrument_tokens(symbols)
+            
+            quotes = {
+                symbol: self._quotes[token]
+                for symbol, token in tokens.items()
+                if token in self._quotes
             }
             
-            # Get quote for all symbols
-            quotes = self.kite.quote(list(instruments.values()))
+            # Get quote for the symbols without a streamed tick
+            missing = {token: symbol for symbol, token in tokens.items() if symbol not in quotes}
+            if missing:
+                for token, quote in self.kite.quote(list(missing)).items():
+                    quotes[missing[int(token)]] = quote
             
             return {
-                symbol: {
-                    'last_price': quote['last_price'],
-                    'bid_price': quote.get('depth', {}).get('buy', [{}])[0].get('price', 0),
-                    'ask_price': quote.get('depth', {}).get('sell', [{}])[0].get('price', 0),
-                    'volume': quote.get('volume', 0),
-                    'oi': quote.get('oi', 0),
-                    'delta': quote.get('greeks', {}).get('delta', 0),
-                }
+                symbol: self._to_market_data(quote)
                 for symbol, quote in quotes.items()
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to get market data: {str(e)}")
+            _LOG.error("Failed to get market data: %s", e)
             raise
 
+    def _get_instrument_tokens(self, symbols: List[str]) -> Dict[str, int]:
+        """
+        Resolve trading symbols to Kite instrument tokens.
+        
+        Args:
+            symbols: List of trading symbols
+            
+        Returns:
+            Dictionary of instrument token for each known symbol
+        """
+        instruments = self._get_instruments()
+        return {symbol: instruments[symbol] for symbol in symbols if symbol in instruments}
+
+    def _get_instruments(self) -> Dict[str, int]:
+        """
+        Get the NFO symbol to instrument token map.
+        
+        The instrument list changes at most daily, so it is downloaded once per
+        day, and saved in cache_dir (if given) for restarts on the same day.
+        The details of the watched options are kept alongside it.
+        
+        Returns:
+            Dictionary of instrument token for each NFO trading symbol
+        """
+        with self._instrument_lock:
+            today = date.today()
+            if self._instrument_cache_date == today:
+                return self._instrument_cache
+                
+            cache = self._load_instrument_cache(today)
+            if cache is None:
+                watched = set(self.watch_symbols)
+                instruments, options = {}, {}
+                for instrument in self.kite.instruments(self.kite.EXCHANGE_NFO):
+                    symbol = instrument['tradingsymbol']
+                    instruments[symbol] = instrument['instrument_token']
+                    if symbol in watched:
+                        options[symbol] = {
+                            'instrument_type': instrument['instrument_type'],
+                            'strike': instrument['strike'],
+                            'expiry': str(instrument['expiry'])
+                        }
+                self._save_instrument_cache(today, instruments, options)
+            else:
+                instruments, options = cache
+                
+            self._instrument_cache = instruments
+            self._option_details = options
+            self._instrument_cache_date = today
+            return instruments
+
+    def _load_instrument_cache(self, day: date) -> Optional[Tuple[Dict[str, int], Dict[str, Dict]]]:
+        """
+        Load the saved instrument map if it was written on the given day.
+        
+        Args:
+            day: Date the cache must belong to
+            
+        Returns:
+            Tuple of (saved instrument map, watched option details), or None if
+            the cache is missing, stale or lacks a watched option
+        """
+        if self._instrument_cache_path is None:
+            return None
+            
+        try:
+            with open(self._instrument_cache_path, "r") as f:
+                cache = json.load(f)
+            if cache.get('date') != day.isoformat():
+                return None
+            instruments, options = cache['instruments'], cache['options']
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+            
+        if any(symbol in instruments and symbol not in options for symbol in self.watch_symbols):
+            return None
+        return instruments, options
+
+    def _save_instrument_cache(self, day: date, instruments: Dict[str, int], options: Dict[str, Dict]) -> None:
+        """
+        Save the instrument map for reuse by later runs on the same day.
+        
+        Args:
+            day: Date the map was downloaded
+            instruments: Dictionary of instrument token for each trading symbol
+            options: Type, strike and expiry of each watched option
+        """
+        if self._instrument_cache_path is None:
+            return
+            
+        try:
+            self._instrument_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._instrument_cache_path, "w") as f:
+                json.dump({'date': day.isoformat(), 'instruments': instruments, 'options': options}, f)
+        except OSError as e:
+            _LOG.warning("Failed to save instrument cache: %s", e)
+
+    def get_options_chain(self) -> List[Dict]:
+        """
+        Get the watched options with their latest market data.
+        
+        Streamed options are served from their last tick, the rest are quoted
+        over REST. The underlying price is implied from the chain itself.
+        
+        Returns:
+            List of watched options with their details (empty if none are
+            watched, or the chain has no call/put pair to price the underlying)
+        """
+        if not self.watch_symbols:
+            return []
+            
+        market_data = self.get_market_data(self.watch_symbols)
+        details = self._option_details
+        chain = [
+            {'symbol': symbol, **details[symbol], **data}
+            for symbol, data in market_data.items()
+            if symbol in details
+        ]
+        
+        underlying_price = _implied_underlying_price(chain)
+        if underlying_price is None:
+            return []
+        for option in chain:
+            option['underlying_price'] = underlying_price
+        return chain
+
+    @staticmethod
+    def _to_market_data(quote: Dict) -> Dict:
+        """
+        Convert a Kite REST quote or websocket tick to the strategy's market data format.
+        
+        Args:
+            quote: Quote or FULL-mode tick
+            
+        Returns:
+            Market data dictionary
+        """
+        depth = quote.get('depth') or {}
+        return {
+            'last_price': quote['last_price'],
+            'bid_price': (depth.get('buy') or [{}])[0].get('price', 0),
+            'ask_price': (depth.get('sell') or [{}])[0].get('price', 0),
+            'volume': quote.get('volume', quote.get('volume_traded', 0)),
+            'oi': quote.get('oi', 0),
+            'delta': quote.get('greeks', {}).get('delta', 0),
+        }
+
+    async def start(self) -> None:
+        """Start the websocket feed and run the tick-driven trading loop."""
+        self._loop = asyncio.get_running_loop()
+        self._tick_queue = asyncio.Queue()
+        self._start_ticker()
+        await super().start()
+
+    async def wait_for_market_update(self) -> None:
+        """
+        Wait for the next batch of websocket ticks and cache them.
+        
+        If none arrive within TICK_TIMEOUT (nothing subscribed yet, or the
+        websocket dropped), the cycle runs on REST quotes instead, so exits,
+        adjustments and the trading-hours check keep going. The cached ticks
+        are dropped then, so get_market_data cannot serve their stale prices.
+        """
+        if self.ticker is None:
+            await super().wait_for_market_update()
+            return
+            
+        try:
+            batches = [await asyncio.wait_for(self._tick_queue.get(), self.TICK_TIMEOUT)]
+        except asyncio.TimeoutError:
+            self._poll_rest = True
+            self._quotes.clear()
+            return
+        self._poll_rest = False
+        
+        # Coalesce ticks that arrived while the previous batch was processed
+        while not self._tick_queue.empty():
+            batches.append(self._tick_queue.get_nowait())
+            
+        for ticks in batches:
+            for tick in ticks:
+                token = tick['instrument_token']
+                self._quotes[token] = tick
+                self._dirty_tokens.add(token)
+
+    def _get_portfolio_market_data(self) -> Dict[str, Dict]:
+        """
+        Get market data for held symbols that ticked since the last call.
+        
+        While the websocket is streaming, unchanged positions are left out so
+        the strategy only re-evaluates what moved; without it, or when the last
+        wait for ticks timed out, every held symbol is re-quoted.
+        
+        Returns:
+            Dictionary of market data for each changed held symbol
+        """
+        if self.ticker is None or self._poll_rest:
+            return super()._get_portfolio_market_data()
+            
+        dirty, self._dirty_tokens = self._dirty_tokens, set()
+        portfolio = self.strategy.portfolio
+        
+        market_data = {}
+        for token in dirty:
+            symbol = self._token_symbols.get(token)
+            if symbol is not None and symbol in portfolio:
+                market_data[symbol] = self._to_market_data(self._quotes[token])
+                
+        return market_data
+
+    def _start_ticker(self) -> None:
+        """Connect the Kite websocket in its own thread."""
+        if not self.kite.access_token:
+            _LOG.warning("No access token; falling back to polling market data")
+            return
+            
+        self.ticker = KiteTicker(self.kite.api_key, self.kite.access_token)
+        self.ticker.on_connect = self._on_connect
+        self.ticker.on_ticks = self._on_ticks
+        self.ticker.on_order_update = self._on_order_update
+        self.ticker.connect(threaded=True)
+
+    def _subscribe(self, symbols: List[str]) -> None:
+        """
+        Stream FULL-mode ticks (depth and open interest) for symbols.
+        
+        Resolving the tokens may download the instrument list, so this runs
+        in the thread pool rather than on the trading loop.
+        
+        Args:
+            symbols: List of trading symbols
+        """
+        if self.ticker is None or not symbols:
+            return
+            
+        try:
+            symbol_tokens = self._get_instrument_tokens(symbols)
+        except Exception as e:
+            _LOG.error("Failed to subscribe to market data: %s", e)
+            return
+        self._token_symbols.update((token, symbol) for symbol, token in symbol_tokens.items())
+        
+        tokens = list(symbol_tokens.values())
+        if tokens:
+            # The websocket belongs to the twisted reactor thread
+            reactor.callFromThread(self._send_subscription, tokens)
+
+    def _send_subscription(self, tokens: List[int]) -> None:
+        """
+        Subscribe instrument tokens in FULL mode; runs on the reactor thread.
+        
+        Args:
+            tokens: Instrument tokens to stream
+        """
+        if self.ticker is not None and self.ticker.is_connected():
+            self.ticker.subscribe(tokens)
+            self.ticker.set_mode(self.ticker.MODE_FULL, tokens)
+
+    def _subscribe_all(self) -> None:
+        """Subscribe to the held positions and the watched option chain, off the trading loop."""
+        self._loop.run_in_executor(None, self._subscribe, [*self.strategy.portfolio.symbols, *self.watch_symbols])
+
+    def _on_connect(self, ws, response) -> None:
+        """Subscribe to the held positions and watched options once the websocket (re)connects."""
+        if self.busy_poll_us:
+            self._tune_ticker_socket(ws)
+        self._loop.call_soon_threadsafe(self._subscribe_all)
+
+    def _tune_ticker_socket(self, ws) -> None:
+        """
+        Apply TCP_NODELAY and SO_BUSY_POLL to the websocket's TCP socket.
+        
+        Args:
+            ws: Connected websocket protocol
+        """
+        try:
+            sock = ws.transport.getHandle()
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, self.busy_poll_us)
+        except Exception as e:
+            _LOG.warning("Failed to tune websocket socket: %s", e)
+
+    def _on_ticks(self, ws, ticks: List[Dict]) -> None:
+        """Hand ticks from the websocket thread to the trading loop."""
+        self._loop.call_soon_threadsafe(self._tick_queue.put_nowait, ticks)
+
+    def _on_order_update(self, ws, order: Dict) -> None:
+        """Handle order updates on the trading loop's thread."""
+        self._loop.call_soon_threadsafe(self._handle_order_update, order)
+
     def get_positions(self) -> List[Dict]:
         """
         Get current live positions from Zerodha.
@@ -188,7 +656,7 @@ class LiveTradingExecutor(TradingExecutor):
             ]
             
         except Exception as e:
-            self.logger.error(f"Failed to get positions: {str(e)}")
+            _LOG.error("Failed to get positions: %s", e)
             raise
 
     def get_orders(self) -> List[Dict]:
@@ -202,7 +670,7 @@ class LiveTradingExecutor(TradingExecutor):
             return self.kite.orders()
             
         except Exception as e:
-            self.logger.error(f"Failed to get orders: {str(e)}")
+            _LOG.error("Failed to get orders: %s", e)
             raise
 
     def _handle_order_update(self, order: Dict) -> None:
@@ -213,39 +681,50 @@ class LiveTradingExecutor(TradingExecutor):
             order: Order update data
         """
         try:
-            self.logger.info(f"Order update received: {order}")
+            if _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Order update received: %s", order)
             
             if order['status'] == self.kite.STATUS_COMPLETE:
                 # Update strategy portfolio
                 symbol = order['tradingsymbol']
                 quantity = order['quantity']
-                price = Decimal(str(order['average_price']))
+                price = float(order['average_price'])
                 
                 if order['transaction_type'] == self.kite.TRANSACTION_TYPE_BUY:
+                    match = _OPTION_SYMBOL_RE.match(symbol)
+                    if match is None:
+                        raise ValueError(f"Unrecognized option symbol: {symbol}")
+                        
                     # Add to portfolio
                     position = Position(
                         symbol=symbol,
                         quantity=quantity,
                         entry_price=price,
                         current_price=price,
-                        delta=Decimal('0'),  # Will be updated with market data
-                        option_type=symbol[-2:],  # Assuming CE/PE suffix
-                        strike_price=int(symbol.split()[1]),  # Assuming format like "BANKNIFTY 35000 CE"
-                        expiry=symbol.split()[0]  # Will need proper parsing based on symbol format
+                        delta=0.0,  # Will be updated with market data
+                        option_type=match['option_type'],
+                        strike_price=int(match['strike']),
+                        expiry=match['expiry']  # Will need proper parsing based on symbol format
                     )
                     self.strategy.portfolio.add_position(position)
+                    self._loop.run_in_executor(None, self._subscribe, [symbol])
                     
                 else:  # SELL
                     # Remove from portfolio
                     self.strategy.portfolio.remove_position(symbol)
                     
         except Exception as e:
-            self.logger.error(f"Failed to handle order update: {str(e)}")
+            _LOG.error("Failed to handle order update: %s", e)
 
     def disconnect(self) -> None:
         """Clean up and disconnect from Zerodha."""
         try:
-            # Implement any cleanup needed
-            self.logger.info("Disconnected from trading session")
+            if self.ticker is not None:
+                self.ticker.close()
+                
+            if self._order_pool is not None:
+                self._order_pool.shutdown(wait=True)
+                
+            _LOG.info("Disconnected from trading session")
         except Exception as e:
-            self.logger.error(f"Error during disconnect: {str(e)}")
\ No newline at end of file
+            _LOG.error("Error during disconnect: %s", e)
\ No newline at end of file
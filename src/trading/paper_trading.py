@@ -1,11 +1,15 @@
-from typing import Dict, List
+from typing import Dict, List, Union
+from dataclasses import asdict
+import numpy as np
 import pandas as pd
-from decimal import Decimal
 from datetime import datetime
 import logging
 
-from trading.base import TradingExecutor
-from strategy.portfolio import Position
+from trading.base import OrderResult, TradingExecutor
+from strategy.kernels import apply_fill
+from strategy.portfolio import PortfolioManager, Position
+
+_LOG = logging.getLogger(__name__)
 
 class PaperTradingExecutor(TradingExecutor):
     """Paper trading implementation for testing strategies."""
@@ -19,30 +23,36 @@ class PaperTradingExecutor(TradingExecutor):
             data_path: Path to historical market data (optional)
         """
         super().__init__(strategy)
-        self.positions: Dict[str, Position] = {}
-        self.orders: List[Dict] = []
-        self.market_data = self._load_market_data(data_path) if data_path else {}
+        self.positions = PortfolioManager()
+        self.orders: List[OrderResult] = []
+        
+        # Latest market data row of each symbol, built once from the loaded frame
+        market_data = self._load_market_data(data_path) if data_path else pd.DataFrame()
+        self._symbol_index: Dict[str, Dict] = market_data.to_dict('index')
+        
         self.current_time = datetime.now()
-        self.logger = logging.getLogger(__name__)
 
-    def _load_market_data(self, data_path: str) -> Dict:
+    def _load_market_data(self, data_path: str) -> pd.DataFrame:
         """
         Load historical market data from file.
         
+        Rows are assumed to be in time order, so the last row of each symbol
+        is its current market state.
+        
         Args:
             data_path: Path to market data file
             
         Returns:
-            Dictionary of market data
+            DataFrame of market data indexed by symbol
         """
         try:
             df = pd.read_csv(data_path)
-            return df.to_dict('records')
+            return df.drop_duplicates('symbol', keep='last').set_index('symbol')
         except Exception as e:
-            self.logger.error(f"Failed to load market data: {str(e)}")
-            return {}
+            _LOG.error("Failed to load market data: %s", e)
+            return pd.DataFrame()
 
-    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> Dict:
+    def place_order(self, symbol: str, quantity: int, side: str, order_type: str = "MARKET") -> OrderResult:
         """
         Simulate order placement in paper trading.
         
@@ -59,46 +69,43 @@ class PaperTradingExecutor(TradingExecutor):
         if not market_data or symbol not in market_data:
             raise ValueError(f"No market data available for {symbol}")
 
-        current_price = Decimal(str(market_data[symbol]['last_price']))
-        
-        order = {
-            'symbol': symbol,
-            'quantity': quantity,
-            'side': side,
-            'type': order_type,
-            'price': current_price,
-            'status': 'COMPLETE',
-            'timestamp': datetime.now(),
-            'order_id': len(self.orders) + 1
-        }
+        current_price = float(market_data[symbol]['last_price'])
+        
+        order = OrderResult(
+            symbol=symbol,
+            quantity=quantity,
+            side=side,
+            order_type=order_type,
+            status='COMPLETE',
+            order_id=str(len(self.orders) + 1),
+            average_price=current_price,
+            timestamp=datetime.now()
+        )
         
         self.orders.append(order)
         
         # Update positions
+        positions = self.positions
+        i = positions.index_of(symbol)
         if side == "BUY":
-            if symbol not in self.positions:
-                self.positions[symbol] = Position(
+            if i is None:
+                positions.add_position(Position(
                     symbol=symbol,
                     quantity=quantity,
                     entry_price=current_price,
                     current_price=current_price,
-                    delta=Decimal(str(market_data[symbol].get('delta', 0))),
+                    delta=float(market_data[symbol].get('delta', 0)),
                     option_type=market_data[symbol].get('instrument_type', ''),
                     strike_price=market_data[symbol].get('strike', 0),
                     expiry=market_data[symbol].get('expiry', '')
-                )
+                ))
             else:
-                pos = self.positions[symbol]
-                avg_price = (pos.entry_price * pos.quantity + current_price * quantity) / (pos.quantity + quantity)
-                pos.quantity += quantity
-                pos.entry_price = avg_price
+                apply_fill(positions.quantity, positions.entry_price, i, quantity, current_price)
                 
         elif side == "SELL":
-            if symbol in self.positions:
-                pos = self.positions[symbol]
-                pos.quantity -= quantity
-                if pos.quantity <= 0:
-                    del self.positions[symbol]
+            if i is not None:
+                if apply_fill(positions.quantity, positions.entry_price, i, -quantity, current_price) <= 0:
+                    positions.remove_position(symbol)
                     
         return order
 
@@ -112,7 +119,8 @@ class PaperTradingExecutor(TradingExecutor):
         Returns:
             Dictionary of market data for requested symbols
         """
-        if not self.market_data:
+        index = self._symbol_index
+        if not index:
             # Simulate some basic market data if no historical data is loaded
             return {
                 symbol: {
@@ -129,29 +137,50 @@ class PaperTradingExecutor(TradingExecutor):
             }
             
         # Filter market data for requested symbols
-        return {
-            symbol: data
-            for symbol in symbols
-            for data in [self.market_data.get(symbol)]
-            if data is not None
-        }
+        return {symbol: index[symbol] for symbol in symbols if symbol in index}
+
+    def get_options_chain(self) -> List[Dict]:
+        """
+        Get every option the executor holds market data for.
+        
+        Returns:
+            List of available options with their details
+        """
+        return [
+            {'symbol': symbol, **data}
+            for symbol, data in self._symbol_index.items()
+            if data.get('instrument_type') in ('CE', 'PE')
+        ]
 
     def get_positions(self) -> List[Dict]:
         """
         Get current paper trading positions.
         
+        Positions are tracked in float64; prices and P&L are rounded to two
+        decimals only here, for reporting.
+        
         Returns:
             List of current positions
         """
+        positions = self.positions
+        n = len(positions)
+        quantity = positions.quantity[:n]
+        entry_price = positions.entry_price[:n]
+        current_price = positions.current_price[:n]
+        pnl = (current_price - entry_price) * quantity
+        
         return [
             {
                 'symbol': symbol,
-                'quantity': position.quantity,
-                'entry_price': float(position.entry_price),
-                'current_price': float(position.current_price),
-                'pnl': float(position.pnl)
+                'quantity': qty,
+                'entry_price': round(entry, 2),
+                'current_price': round(current, 2),
+                'pnl': round(position_pnl, 2)
             }
-            for symbol, position in self.positions.items()
+            for symbol, qty, entry, current, position_pnl in zip(
+                positions.symbols, quantity.tolist(), entry_price.tolist(),
+                current_price.tolist(), pnl.tolist()
+            )
         ]
 
     def get_orders(self) -> List[Dict]:
@@ -161,21 +190,36 @@ class PaperTradingExecutor(TradingExecutor):
         Returns:
             List of orders
         """
-        return self.orders
+        return [asdict(order) for order in self.orders]
 
-    def simulate_market_update(self, market_data: Dict[str, Dict]) -> None:
+    def simulate_market_update(self, market_data: Union[Dict[str, Dict], pd.DataFrame]) -> None:
         """
         Simulate market data updates for paper trading.
         
         Args:
-            market_data: Updated market data
+            market_data: Updated market data, as a dictionary or DataFrame keyed by symbol
         """
-        self.market_data.update(market_data)
+        if isinstance(market_data, pd.DataFrame):
+            market_data = market_data.to_dict('index')
+            
+        # Merge into each symbol's row so partial updates keep the other fields
+        index = self._symbol_index
+        for symbol, data in market_data.items():
+            row = index.get(symbol)
+            if row is None:
+                index[symbol] = dict(data)
+            else:
+                row.update(data)
+        
+        # Scatter the new prices and deltas into the position arrays in one pass each
+        positions = self.positions
+        held = [symbol for symbol in market_data if symbol in positions]
+        if not held:
+            return
+            
+        rows = np.fromiter((positions.index_of(symbol) for symbol in held), dtype=np.int64, count=len(held))
+        positions.current_price[rows] = [market_data[symbol]['last_price'] for symbol in held]
         
-        # Update position prices
-        for symbol, position in self.positions.items():
-            if symbol in market_data:
-                data = market_data[symbol]
-                position.current_price = Decimal(str(data['last_price']))
-                if 'delta' in data:
-                    position.delta = Decimal(str(data['delta']))
\ No newline at end of file
+        with_delta = [k for k, symbol in enumerate(held) if 'delta' in market_data[symbol]]
+        if with_delta:
+            positions.delta[rows[with_delta]] = [market_data[held[k]]['delta'] for k in with_delta]
@@ -1,8 +1,32 @@
-import json
 import os
-from typing import Dict, Any
+import orjson
+from typing import Callable, Dict, Any, List
 from pathlib import Path
 
+def _build_validator(required_fields: Dict[str, List[str]]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Generate a validator with one straight-line check per required field.
+    
+    Args:
+        required_fields: Required fields of each config section
+        
+    Returns:
+        Function raising ValueError for the first missing section or field
+    """
+    lines = ["def validate(config):"]
+    for section, fields in required_fields.items():
+        lines.append(f"    if {section!r} not in config:")
+        lines.append(f"        raise ValueError({'Missing required config section: ' + section!r})")
+        lines.append(f"    section = config[{section!r}]")
+        for field in fields:
+            lines.append(f"    if {field!r} not in section:")
+            lines.append(f"        raise ValueError({'Missing required config field: ' + section + '.' + field!r})")
+    lines.append("    return None")
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<config validator>", "exec"), namespace)
+    return namespace['validate']
+
 class ConfigManager:
     """Manages configuration settings for the trading strategy."""
     
@@ -12,6 +36,12 @@ class ConfigManager:
         'strategy': ['target_delta', 'position_sizing', 'adjustment_threshold'],
         'zerodha': ['api_key', 'api_secret']
     }
+    _validator = staticmethod(_build_validator(REQUIRED_FIELDS))
+
+    def __init_subclass__(cls, **kwargs):
+        """Regenerate the validator for subclasses that override REQUIRED_FIELDS."""
+        super().__init_subclass__(**kwargs)
+        cls._validator = staticmethod(_build_validator(cls.REQUIRED_FIELDS))
 
     def __init__(self, config_path: str = None):
         """
@@ -33,7 +63,7 @@ class ConfigManager:
         
         Raises:
             FileNotFoundError: If config file doesn't exist
-            json.JSONDecodeError: If config file is not valid JSON
+            orjson.JSONDecodeError: If config file is not valid JSON
         """
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(
@@ -41,23 +71,20 @@ class ConfigManager:
                 "Please copy config.sample.json to config.json and update with your settings."
             )
 
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        with open(self.config_path, 'rb') as f:
+            return orjson.loads(f.read())
 
     def _validate_config(self) -> None:
         """
         Validate that all required configuration fields are present.
         
+        The checks are generated from REQUIRED_FIELDS once, when the class is
+        defined, instead of walking the field table on every instance.
+        
         Raises:
             ValueError: If any required field is missing
         """
-        for section, fields in self.REQUIRED_FIELDS.items():
-            if section not in self.config:
-                raise ValueError(f"Missing required config section: {section}")
-            
-            for field in fields:
-                if field not in self.config[section]:
-                    raise ValueError(f"Missing required config field: {section}.{field}")
+        self._validator(self.config)
 
     def get(self, section: str, field: str = None) -> Any:
         """
@@ -103,8 +130,8 @@ class ConfigManager:
 
     def save(self) -> None:
         """Save current configuration to file."""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        with open(self.config_path, 'wb') as f:
+            f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
 
     @classmethod
     def create_default_config(cls, path: str = None) -> None:
@@ -123,12 +150,12 @@ class ConfigManager:
         if os.path.exists(path):
             raise FileExistsError("Config file already exists")
             
-        with open(sample_path, 'r') as f:
-            sample_config = json.load(f)
+        with open(sample_path, 'rb') as f:
+            sample_config = orjson.loads(f.read())
             
-        with open(path, 'w') as f:
-            json.dump(sample_config, f, indent=4)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(sample_config, option=orjson.OPT_INDENT_2))
 
     def __str__(self) -> str:
         """String representation of current configuration."""
-        return json.dumps(self.config, indent=2)
\ No newline at end of file
+        return orjson.dumps(self.config, option=orjson.OPT_INDENT_2).decode()
\ No newline at end of file
@@ -1,10 +1,239 @@
+import atexit
+import collections
+import gzip
 import logging
 import logging.handlers
+import math
 import os
+import queue
+import shutil
+import struct
+import threading
+import time
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
-import json
+from typing import Iterable, List, Optional
+from datetime import datetime, timezone
+import numpy as np
+import orjson
+
+# Accept what json.dumps did: NumPy values and non-string dict keys
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_ROOT_LOGGER = logging.getLogger()
+_TRADE_LOGGER = logging.getLogger('trades')
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+def _ns_to_iso(timestamp: int) -> str:
+    """Format an epoch timestamp in nanoseconds as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp / 1e9, tz=timezone.utc).isoformat()
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, continuing after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _write_chunks(fd: int, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a file descriptor in as few system calls as possible.
+    
+    Chunks are handed to the kernel as one gather write per IOV_MAX chunks
+    instead of being joined first; platforms without os.writev fall back to
+    a single joined write.
+    
+    Args:
+        fd: File descriptor to write to
+        chunks: Byte strings to write, in order
+    """
+    if not hasattr(os, 'writev'):
+        _write_all(fd, b''.join(chunks))
+        return
+        
+    for start in range(0, len(chunks), _IOV_MAX):
+        group = chunks[start:start + _IOV_MAX]
+        written = os.writev(fd, group)
+        if written < sum(map(len, group)):
+            _write_all(fd, b''.join(group)[written:])
+
+def _encode_json_line(record: dict) -> bytes:
+    """Serialize a metric record as a JSON line, formatting its epoch-ns timestamp as ISO 8601."""
+    return orjson.dumps({**record, 'timestamp': _ns_to_iso(record['timestamp'])},
+                        option=_JSON_OPTIONS) + b'\n'
+
+# Length prefix of each MessagePack frame
+_FRAME_HEADER = struct.Struct('<I')
+
+def _numpy_to_builtin(obj):
+    """msgspec enc_hook converting NumPy scalars to the matching Python type."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__}")
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=_numpy_to_builtin) if msgspec is not None else None
+
+def _encode_msgpack_frame(record: dict) -> bytes:
+    """Serialize a metric record as a length-prefixed MessagePack frame; the timestamp stays in epoch ns."""
+    payload = _MSGPACK_ENCODER.encode(record)
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+# File extension and record encoder of each metrics codec
+_CODECS = {
+    'json': ('.jsonl', _encode_json_line),
+    'msgpack': ('.msgpack', _encode_msgpack_frame),
+}
+
+def dump_to_json(path: str, output_path: Optional[str] = None) -> Path:
+    """
+    Convert a MessagePack metric stream file to JSON Lines for inspection.
+    
+    Args:
+        path: Path of a .msgpack file written by PerformanceMonitor
+        output_path: Path of the JSON Lines file (default: path with a .jsonl suffix)
+        
+    Returns:
+        Path of the JSON Lines file
+    """
+    if msgspec is None:
+        raise ImportError("Reading msgpack metrics requires msgspec (pip install msgspec)")
+        
+    path = Path(path)
+    output_path = Path(output_path) if output_path else path.with_suffix('.jsonl')
+    decoder = msgspec.msgpack.Decoder()
+    data = memoryview(path.read_bytes())
+    
+    lines = []
+    offset = 0
+    while offset + _FRAME_HEADER.size <= len(data):
+        (size,) = _FRAME_HEADER.unpack_from(data, offset)
+        offset += _FRAME_HEADER.size
+        lines.append(_encode_json_line(decoder.decode(data[offset:offset + size])))
+        offset += size
+        
+    output_path.write_bytes(b''.join(lines))
+    return output_path
+
+# Most buffers one os.writev call accepts (POSIX guarantees at least 16)
+try:
+    _IOV_MAX = max(os.sysconf('SC_IOV_MAX'), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# Series longer than this use the compiled drawdown kernel when Numba is installed
+_JIT_MIN_POINTS = 1024
+
+def _max_drawdown_kernel(values):
+    """
+    Maximum drawdown of a series, as a fraction, in one pass.
+    
+    Args:
+        values: float64 array of values
+        
+    Returns:
+        Maximum drawdown as a fraction of the running peak
+    """
+    peak = values[0]
+    max_drawdown = 0.0
+    for value in values:
+        if value > peak:
+            peak = value
+        drawdown = (peak - value) / peak if peak != 0 else 0.0
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+    return max_drawdown
+
+# Compiled lazily on the first long series and not cached on disk: the cache
+# records the importing module's name, and this module is imported as both
+# src.utils.monitoring and utils.monitoring
+if njit is not None:
+    _max_drawdown_kernel = njit(fastmath=True)(_max_drawdown_kernel)
+
+def _gzip_file(path: str) -> None:
+    """
+    Compress a rotated log file to path.gz and remove the original.
+    
+    Args:
+        path: Path of the rotated file
+    """
+    try:
+        with open(path, 'rb') as src, gzip.open(f"{path}.gz.tmp", 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(f"{path}.gz.tmp", f"{path}.gz")
+        os.remove(path)
+    except OSError as e:
+        _ROOT_LOGGER.error("Failed to compress %s: %s", path, e)
+
+class BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler that writes through a large buffer.
+    
+    The stream is flushed only for ERROR and above; lower-level records
+    accumulate in the buffer until it fills or the handler is closed. The
+    rollover check is a timestamp comparison, and a rollover only renames the
+    file: the rotated file is gzipped on a background thread.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+        
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+        
+    def emit(self, record) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+                
+            self.stream.write(self.format(record) + self.terminator)
+            
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+            
+    def rotate(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+        os.rename(source, dest)
+        threading.Thread(target=_gzip_file, args=(dest,), name="log-compress", daemon=True).start()
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats the date and time of a second only once.
+    
+    The default formatTime calls localtime and strftime for every record;
+    here the second's text is cached and only the milliseconds are appended.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, text) is replaced as one tuple, so listener threads sharing
+        # the formatter never pair one second with another's text
+        self._cached_second = (-1, '')
+        
+    def formatTime(self, record, datefmt=None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+            
+        second = int(record.created)
+        cached_second, text = self._cached_second
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+# Shared by every TradingLogger handler
+_FORMATTER = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 class TradingLogger:
     """Configures and manages logging for the trading system."""
@@ -19,58 +248,95 @@ class TradingLogger:
         """
         self.log_dir = Path(log_dir)
         self.log_level = getattr(logging, log_level.upper())
+        self._listeners = []
         self._setup_logging()
 
     def _setup_logging(self) -> None:
-        """Set up logging configuration."""
+        """
+        Set up logging configuration.
+        
+        Loggers only enqueue records; QueueListener threads run the file and
+        console handlers, so logging calls never wait on I/O.
+        """
         # Create logs directory if it doesn't exist
         self.log_dir.mkdir(exist_ok=True)
 
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        formatter = _FORMATTER
 
-        # Create rotating file handler for general logs
-        general_handler = logging.handlers.RotatingFileHandler(
+        # Create daily rotating file handler for general logs
+        general_handler = BufferedTimedRotatingFileHandler(
             self.log_dir / 'trading.log',
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            when='midnight',
+            backupCount=7,
+            utc=True,
+            encoding='utf-8',
+            delay=True  # Only create the file once a record is written
         )
         general_handler.setFormatter(formatter)
 
-        # Create rotating file handler for trade logs
-        trade_handler = logging.handlers.RotatingFileHandler(
+        # Create daily rotating file handler for trade logs
+        trade_handler = BufferedTimedRotatingFileHandler(
             self.log_dir / 'trades.log',
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            when='midnight',
+            backupCount=7,
+            utc=True,
+            encoding='utf-8',
+            delay=True  # Only create the file once a record is written
         )
         trade_handler.setFormatter(formatter)
 
-        # Create rotating file handler for errors
-        error_handler = logging.handlers.RotatingFileHandler(
+        # Create daily rotating file handler for errors
+        error_handler = BufferedTimedRotatingFileHandler(
             self.log_dir / 'errors.log',
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+            when='midnight',
+            backupCount=7,
+            utc=True,
+            encoding='utf-8',
+            delay=True  # Only create the file once a record is written
         )
         error_handler.setFormatter(formatter)
         error_handler.setLevel(logging.ERROR)
 
-        # Set up console handler
+        # Set up console handler; trading.log already has every record, so it only shows warnings and errors
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
+        console_handler.setLevel(logging.WARNING)
 
         # Configure root logger
-        root_logger = logging.getLogger()
+        root_logger = _ROOT_LOGGER
         root_logger.setLevel(self.log_level)
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(general_handler)
-        root_logger.addHandler(error_handler)
+        root_logger.addHandler(self._start_listener(console_handler, general_handler, error_handler))
 
         # Create trade logger
-        trade_logger = logging.getLogger('trades')
-        trade_logger.addHandler(trade_handler)
+        trade_logger = _TRADE_LOGGER
+        trade_logger.addHandler(self._start_listener(trade_handler, error_handler))
         trade_logger.setLevel(self.log_level)
+        # Trade records only go to trades.log (and errors.log), not through the root handlers too
+        trade_logger.propagate = False
+        
+        atexit.register(self.stop)
+
+    def _start_listener(self, *handlers: logging.Handler) -> logging.Handler:
+        """
+        Run handlers on a background listener thread.
+        
+        Args:
+            *handlers: Handlers that receive the queued records
+            
+        Returns:
+            QueueHandler feeding the listener
+        """
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        self._listeners.append(listener)
+        return logging.handlers.QueueHandler(log_queue)
+
+    def stop(self) -> None:
+        """Write out queued records and stop the listener threads."""
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
 
     @staticmethod
     def log_trade(trade_data: dict) -> None:
@@ -80,8 +346,8 @@ class TradingLogger:
         Args:
             trade_data: Dictionary containing trade details
         """
-        logger = logging.getLogger('trades')
-        logger.info(f"Trade executed: {json.dumps(trade_data)}")
+        if _TRADE_LOGGER.isEnabledFor(logging.INFO):
+            _TRADE_LOGGER.info("Trade executed: %s", orjson.dumps(trade_data, option=_JSON_OPTIONS).decode())
 
     @staticmethod
     def log_portfolio_update(portfolio_data: dict) -> None:
@@ -91,8 +357,8 @@ class TradingLogger:
         Args:
             portfolio_data: Dictionary containing portfolio details
         """
-        logger = logging.getLogger('trades')
-        logger.info(f"Portfolio update: {json.dumps(portfolio_data)}")
+        if _TRADE_LOGGER.isEnabledFor(logging.INFO):
+            _TRADE_LOGGER.info("Portfolio update: %s", orjson.dumps(portfolio_data, option=_JSON_OPTIONS).decode())
 
     @staticmethod
     def log_error(error: Exception, context: Optional[str] = None) -> None:
@@ -103,32 +369,127 @@ class TradingLogger:
             error: Exception that occurred
             context: Additional context about the error
         """
-        logger = logging.getLogger()
-        error_msg = f"{str(error)}"
+        if not _ROOT_LOGGER.isEnabledFor(logging.ERROR):
+            return
         if context:
-            error_msg = f"{context}: {error_msg}"
-        logger.error(error_msg, exc_info=True)
+            _ROOT_LOGGER.error("%s: %s", context, error, exc_info=True)
+        else:
+            _ROOT_LOGGER.error("%s", error, exc_info=True)
 
 class PerformanceMonitor:
-    """Monitors and tracks trading strategy performance."""
+    """
+    Monitors and tracks trading strategy performance.
+    
+    Not thread-safe: record trades and portfolio updates from a single thread.
+    """
+    
+    # Seconds the writer thread sleeps between drains of the pending records
+    WRITE_INTERVAL = 0.05
+    
+    # Initial number of portfolio observations the series arrays hold
+    SERIES_CAPACITY = 1024
+    
+    # Default disk space reserved up front for each metric stream file. Off:
+    # where the filesystem lacks native fallocate (NFS, tmpfs on old kernels,
+    # some FUSE mounts) glibc emulates it by writing zeros, which costs far
+    # more than it saves.
+    PREALLOCATE_BYTES = 0
+    
+    # Portfolio metric streams and the portfolio_data key each one records
+    SERIES = (('pnl', 'total_pnl'),
+              ('portfolio_value', 'portfolio_value'),
+              ('delta_exposure', 'total_delta'))
 
-    def __init__(self, output_dir: str = "results"):
+    def __init__(self, output_dir: str = "results", codec: str = "json",
+                 preallocate_bytes: int = PREALLOCATE_BYTES):
         """
         Initialize the performance monitor.
         
         Args:
             output_dir: Directory to store performance results
+            codec: Format of the metric stream files: "json" (JSON Lines) or
+                "msgpack" (length-prefixed MessagePack frames, needs msgspec;
+                see dump_to_json)
+            preallocate_bytes: Disk space to reserve for each metric stream
+                file (0 to disable). Only worth enabling on local filesystems
+                with native fallocate support, such as ext4 or XFS.
         """
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown metrics codec: {codec}")
+        if codec == 'msgpack' and msgspec is None:
+            raise ImportError("The msgpack metrics codec requires msgspec (pip install msgspec)")
+        extension, self._encode = _CODECS[codec]
+        
+        self.preallocate_bytes = preallocate_bytes
+        # Preallocated files are hidden under a .part name until close() trims them
+        self._part_suffix = '.part' if preallocate_bytes else ''
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
         self.current_session = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.metrics = {
-            'trades': [],
-            'pnl': [],
-            'portfolio_value': [],
-            'delta_exposure': []
+        self.trades: List[dict] = []
+        
+        # Portfolio series as parallel arrays: epoch-ns timestamps shared by
+        # every stream, one float64 column per stream, first _n rows in use
+        self._timestamps = np.empty(self.SERIES_CAPACITY, dtype=np.int64)
+        self._series = {
+            stream: np.empty(self.SERIES_CAPACITY, dtype=np.float64)
+            for stream, _ in self.SERIES
+        }
+        self._n = 0
+        
+        # Running totals so generate_report does not rescan the metrics
+        self._win_count = self._loss_count = 0
+        self._delta_sum = 0.0
+        
+        # Welford accumulator of step returns of the P&L series, for the Sharpe ratio
+        self._ret_n = 0
+        self._ret_mean = 0.0
+        self._ret_m2 = 0.0
+        self._prev_pnl = None
+        
+        # One file per metric stream, written sequentially through a raw descriptor
+        self._paths = {
+            stream: self.output_dir / f"performance_{self.current_session}_{stream}{extension}"
+            for stream in ('trades', *self._series)
         }
+        self._fds = {stream: self._open_stream(path) for stream, path in self._paths.items()}
+        
+        # Records are encoded and written in batches by a background thread.
+        # Producers only append to the deque (atomic under the GIL, no lock or
+        # wakeup); the writer drains it every WRITE_INTERVAL seconds. The
+        # series arrays and running totals are not locked: the record_* methods
+        # must all be called from one thread (the trading loop's, in every runner).
+        self._pending = collections.deque()
+        self._closing = threading.Event()
+        self._writer = threading.Thread(target=self._writer_loop, name="metrics-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _open_stream(self, path: Path) -> int:
+        """
+        Open a metric stream file, reserving preallocate_bytes of disk space past its end.
+        
+        When preallocating, the file is written as <name>.part and only renamed
+        to its final name by close(), once it has been truncated to the bytes
+        actually written; otherwise it is written under its final name.
+        
+        Args:
+            path: Final path of the stream file
+            
+        Returns:
+            File descriptor positioned at the end of the written data
+        """
+        fd = os.open(f"{path}{self._part_suffix}", os.O_WRONLY | os.O_CREAT, 0o644)
+        offset = os.lseek(fd, 0, os.SEEK_END)
+        
+        if self.preallocate_bytes and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, offset, self.preallocate_bytes)
+            except OSError as e:
+                self.logger.warning("Failed to preallocate %s: %s", path, e)
+                
+        return fd
 
     def record_trade(self, trade_data: dict) -> None:
         """
@@ -137,11 +498,19 @@ class PerformanceMonitor:
         Args:
             trade_data: Dictionary containing trade details
         """
-        self.metrics['trades'].append({
-            'timestamp': datetime.now().isoformat(),
+        # Timestamps are kept as epoch nanoseconds and only formatted on output
+        record = {
+            'timestamp': time.time_ns(),
             **trade_data
-        })
-        self._save_metrics()
+        }
+        self.trades.append(record)
+        self._append('trades', (record,))
+        
+        pnl = trade_data.get('pnl', 0)
+        if pnl > 0:
+            self._win_count += 1
+        elif pnl < 0:
+            self._loss_count += 1
 
     def record_portfolio_update(self, portfolio_data: dict) -> None:
         """
@@ -150,33 +519,211 @@ class PerformanceMonitor:
         Args:
             portfolio_data: Dictionary containing portfolio details
         """
-        timestamp = datetime.now().isoformat()
+        if self._n == len(self._timestamps):
+            self._grow(self._n + 1)
+            
+        i = self._n
+        self._timestamps[i] = timestamp = time.time_ns()
+        self._n = i + 1
         
-        self.metrics['pnl'].append({
-            'timestamp': timestamp,
-            'value': portfolio_data.get('total_pnl', 0)
-        })
+        for stream, key in self.SERIES:
+            value = portfolio_data.get(key, 0)
+            self._series[stream][i] = value
+            self._append(stream, ({'timestamp': timestamp, 'value': value},))
+            
+        self._delta_sum += portfolio_data.get('total_delta', 0)
         
-        self.metrics['portfolio_value'].append({
-            'timestamp': timestamp,
-            'value': portfolio_data.get('portfolio_value', 0)
-        })
+        pnl = self._series['pnl'][i]
+        prev_pnl = self._prev_pnl
+        if prev_pnl:
+            ret = (pnl - prev_pnl) / prev_pnl
+            self._ret_n += 1
+            d = ret - self._ret_mean
+            self._ret_mean += d / self._ret_n
+            self._ret_m2 += d * (ret - self._ret_mean)
+        self._prev_pnl = pnl
+
+    def record_portfolio_bulk(self, timestamps, total_pnl, portfolio_value, total_delta) -> None:
+        """
+        Record a series of portfolio metrics at once.
         
-        self.metrics['delta_exposure'].append({
-            'timestamp': timestamp,
-            'value': portfolio_data.get('total_delta', 0)
-        })
+        Args:
+            timestamps: Timestamp of each observation
+            total_pnl: Total P&L at each timestamp
+            portfolio_value: Portfolio value at each timestamp
+            total_delta: Total delta at each timestamp
+        """
+        timestamps = np.asarray(timestamps).astype('datetime64[ns]').astype(np.int64)
+        start, stop = self._n, self._n + len(timestamps)
+        if stop > len(self._timestamps):
+            self._grow(stop)
+            
+        self._timestamps[start:stop] = timestamps
+        self._n = stop
         
-        self._save_metrics()
+        timestamps = timestamps.tolist()
+        for (stream, _), values in zip(self.SERIES, (total_pnl, portfolio_value, total_delta)):
+            column = self._series[stream]
+            column[start:stop] = values
+            self._append(stream, [
+                {'timestamp': timestamp, 'value': value}
+                for timestamp, value in zip(timestamps, column[start:stop].tolist())
+            ])
+            
+        self._delta_sum += float(self._series['delta_exposure'][start:stop].sum())
+        self._merge_returns(self._series['pnl'][start:stop])
 
-    def _save_metrics(self) -> None:
-        """Save performance metrics to file."""
-        try:
-            output_file = self.output_dir / f"performance_{self.current_session}.json"
-            with open(output_file, 'w') as f:
-                json.dump(self.metrics, f, indent=4)
-        except Exception as e:
-            self.logger.error(f"Failed to save metrics: {str(e)}")
+    def _merge_returns(self, pnl: np.ndarray) -> None:
+        """
+        Fold the step returns of a block of P&L values into the Welford accumulator.
+        
+        The block's count, mean and sum of squared deviations are combined with
+        the running ones in one step (Chan et al.), so the result matches
+        adding the returns one by one.
+        
+        Args:
+            pnl: P&L values following the last recorded one
+        """
+        if not len(pnl):
+            return
+            
+        prev_pnl = np.empty_like(pnl)
+        prev_pnl[0] = self._prev_pnl or 0.0
+        prev_pnl[1:] = pnl[:-1]
+        self._prev_pnl = float(pnl[-1])
+        
+        # Returns off a zero P&L are undefined and skipped
+        valid = prev_pnl != 0
+        returns = (pnl[valid] - prev_pnl[valid]) / prev_pnl[valid]
+        if not len(returns):
+            return
+            
+        n_block = len(returns)
+        mean_block = float(returns.mean())
+        m2_block = float(np.square(returns - mean_block).sum())
+        
+        n = self._ret_n + n_block
+        d = mean_block - self._ret_mean
+        self._ret_mean += d * n_block / n
+        self._ret_m2 += m2_block + d * d * self._ret_n * n_block / n
+        self._ret_n = n
+
+    def _grow(self, min_capacity: int) -> None:
+        """
+        Grow the series arrays, doubling their capacity until it is at least min_capacity.
+        
+        Args:
+            min_capacity: Number of observations the arrays must hold
+        """
+        capacity = len(self._timestamps)
+        while capacity < min_capacity:
+            capacity *= 2
+            
+        n = self._n
+        grown = np.empty(capacity, dtype=np.int64)
+        grown[:n] = self._timestamps[:n]
+        self._timestamps = grown
+        
+        for stream, column in self._series.items():
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:n] = column[:n]
+            self._series[stream] = grown
+
+    def series(self, stream: str) -> np.ndarray:
+        """
+        Get the recorded values of a portfolio metric stream.
+        
+        Args:
+            stream: Stream name ('pnl', 'portfolio_value' or 'delta_exposure')
+            
+        Returns:
+            View of the recorded values, oldest first
+        """
+        return self._series[stream][:self._n]
+
+    def _append(self, stream: str, records: Iterable[dict]) -> None:
+        """
+        Queue records for appending to a metric stream's file.
+        
+        Only the new records are serialized, so the cost of a write does not
+        grow with the length of the session; the caller never waits on I/O.
+        
+        Args:
+            stream: Metric stream name
+            records: Records to append
+        """
+        self._pending.append((stream, records))
+
+    def _writer_loop(self) -> None:
+        """Write pending records, one write per stream per batch, until close() is called."""
+        popleft = self._pending.popleft
+        while True:
+            closing = self._closing.wait(self.WRITE_INTERVAL)
+            
+            # Take everything appended so far; close() is only signalled after the last append
+            pending = {}
+            try:
+                while True:
+                    stream, records = popleft()
+                    pending.setdefault(stream, []).extend(records)
+            except IndexError:
+                pass
+            
+            for stream, records in pending.items():
+                try:
+                    _write_chunks(self._fds[stream], [self._encode(record) for record in records])
+                except Exception as e:
+                    self.logger.error(f"Failed to save metrics: {str(e)}")
+            
+            if closing:
+                return
+
+    def snapshot(self) -> Path:
+        """
+        Write all metrics recorded so far to a single compact JSON file.
+        
+        Returns:
+            Path of the snapshot file
+        """
+        output_file = self.output_dir / f"performance_{self.current_session}.json"
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(self._metrics(), option=_JSON_OPTIONS))
+        return output_file
+
+    def _metrics(self) -> dict:
+        """
+        Build the JSON-ready view of every metric stream.
+        
+        Returns:
+            Dictionary of stream name to list of records
+        """
+        iso_timestamps = [_ns_to_iso(timestamp) for timestamp in self._timestamps[:self._n].tolist()]
+        metrics = {'trades': [{**trade, 'timestamp': _ns_to_iso(trade['timestamp'])} for trade in self.trades]}
+        for stream in self._series:
+            metrics[stream] = [
+                {'timestamp': timestamp, 'value': value}
+                for timestamp, value in zip(iso_timestamps, self.series(stream).tolist())
+            ]
+        return metrics
+
+    def close(self) -> None:
+        """Flush queued records and close the metric stream files."""
+        if not self._writer.is_alive():
+            return
+            
+        self._closing.set()
+        self._writer.join()
+        for stream, fd in self._fds.items():
+            try:
+                if self._part_suffix:
+                    # Drop the unused preallocated tail before publishing the file
+                    os.ftruncate(fd, os.lseek(fd, 0, os.SEEK_CUR))
+                    path = self._paths[stream]
+                    os.replace(f"{path}{self._part_suffix}", path)
+                os.close(fd)
+            except Exception as e:
+                self.logger.error("Failed to finalize metrics: %s", e)
+        atexit.unregister(self.close)
 
     def generate_report(self) -> dict:
         """
@@ -185,16 +732,14 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing performance metrics
         """
-        total_trades = len(self.metrics['trades'])
+        total_trades = len(self.trades)
         if total_trades == 0:
             return {'error': 'No trades recorded'}
 
-        winning_trades = sum(1 for trade in self.metrics['trades'] 
-                           if trade.get('pnl', 0) > 0)
-        losing_trades = sum(1 for trade in self.metrics['trades'] 
-                          if trade.get('pnl', 0) < 0)
+        winning_trades = self._win_count
+        losing_trades = self._loss_count
 
-        pnl_values = [p['value'] for p in self.metrics['pnl']]
+        pnl_values = self.series('pnl')
         max_drawdown = self._calculate_max_drawdown(pnl_values)
         
         return {
@@ -202,11 +747,10 @@ class PerformanceMonitor:
             'winning_trades': winning_trades,
             'losing_trades': losing_trades,
             'win_rate': (winning_trades / total_trades) * 100 if total_trades > 0 else 0,
-            'total_pnl': pnl_values[-1] if pnl_values else 0,
+            'total_pnl': float(pnl_values[-1]) if len(pnl_values) else 0,
             'max_drawdown': max_drawdown,
-            'sharpe_ratio': self._calculate_sharpe_ratio(pnl_values),
-            'average_delta_exposure': sum(d['value'] for d in self.metrics['delta_exposure']) / len(self.metrics['delta_exposure'])
-            if self.metrics['delta_exposure'] else 0
+            'sharpe_ratio': self._calculate_sharpe_ratio(),
+            'average_delta_exposure': self._delta_sum / self._n if self._n else 0
         }
 
     @staticmethod
@@ -220,38 +764,31 @@ class PerformanceMonitor:
         Returns:
             Maximum drawdown percentage
         """
-        max_drawdown = 0
-        peak = values[0]
-        
-        for value in values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak if peak != 0 else 0
-            max_drawdown = max(max_drawdown, drawdown)
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) < 2:
+            return 0.0
+        if njit is not None and len(values) > _JIT_MIN_POINTS:
+            return _max_drawdown_kernel(values) * 100
             
-        return max_drawdown * 100
+        peak = np.maximum.accumulate(values)
+        safe_peak = np.where(peak != 0, peak, 1.0)
+        drawdown = np.where(peak != 0, (peak - values) / safe_peak, 0.0)
+        return max(float(drawdown.max()), 0.0) * 100
 
-    @staticmethod
-    def _calculate_sharpe_ratio(pnl_values: list, risk_free_rate: float = 0.02) -> float:
+    def _calculate_sharpe_ratio(self, risk_free_rate: float = 0.02) -> float:
         """
-        Calculate Sharpe ratio from PnL values.
+        Calculate Sharpe ratio from the running P&L return statistics.
         
         Args:
-            pnl_values: List of PnL values
             risk_free_rate: Annual risk-free rate
             
         Returns:
             Sharpe ratio
         """
-        import numpy as np
-        
-        if len(pnl_values) < 2:
+        if self._ret_n == 0:
             return 0
             
-        returns = np.diff(pnl_values) / pnl_values[:-1]
-        excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free rate
+        std = math.sqrt(self._ret_m2 / self._ret_n)
+        excess_mean = self._ret_mean - (risk_free_rate / 252)  # Daily risk-free rate
         
-        if len(excess_returns) == 0:
-            return 0
-            
-        return np.sqrt(252) * np.mean(excess_returns) / np.std(excess_returns) if np.std(excess_returns) != 0 else 0
\ No newline at end of file
+        return math.sqrt(252) * excess_mean / std if std != 0 else 0
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The packages live under src/ and import each other without the src prefix
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
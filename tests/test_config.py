@@ -0,0 +1,49 @@
+import orjson
+import pytest
+
+from utils.config import ConfigManager
+
+
+def write_config(tmp_path, config):
+    path = tmp_path / "config.json"
+    path.write_bytes(orjson.dumps(config))
+    return str(path)
+
+
+def valid_config():
+    return {
+        'trading': {'mode': 'paper', 'capital': 1, 'max_loss_percentage': 1, 'target_profit_percentage': 1},
+        'strategy': {'target_delta': 0, 'position_sizing': 1, 'adjustment_threshold': 0.1},
+        'zerodha': {'api_key': 'k', 'api_secret': 's'}
+    }
+
+
+def test_valid_config_loads(tmp_path):
+    config = ConfigManager(write_config(tmp_path, valid_config()))
+    assert config.get('trading', 'mode') == 'paper'
+
+
+def test_missing_section_is_reported(tmp_path):
+    config = valid_config()
+    del config['zerodha']
+
+    with pytest.raises(ValueError, match="Missing required config section: zerodha"):
+        ConfigManager(write_config(tmp_path, config))
+
+
+def test_missing_field_is_reported(tmp_path):
+    config = valid_config()
+    del config['strategy']['position_sizing']
+
+    with pytest.raises(ValueError, match=r"Missing required config field: strategy\.position_sizing"):
+        ConfigManager(write_config(tmp_path, config))
+
+
+def test_subclass_fields_regenerate_the_validator(tmp_path):
+    class ExtraConfig(ConfigManager):
+        REQUIRED_FIELDS = {**ConfigManager.REQUIRED_FIELDS, 'logging': ['level']}
+
+    path = write_config(tmp_path, valid_config())
+    ConfigManager(path)
+    with pytest.raises(ValueError, match="Missing required config section: logging"):
+        ExtraConfig(path)
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from strategy.delta_neutral import DeltaNeutralStrategy
+from strategy.portfolio import Position
+
+
+def make_config(max_positions=4, min_premium=50, target_delta=0.0):
+    return {
+        'trading': {
+            'mode': 'paper',
+            'capital': 100000,
+            'max_loss_percentage': 2.0,
+            'target_profit_percentage': 1.0,
+            'trading_hours': {'start': '09:15', 'end': '15:30'}
+        },
+        'strategy': {
+            'target_delta': target_delta,
+            'position_sizing': 1.0,
+            'adjustment_threshold': 0.1,
+            'max_positions': max_positions,
+            'min_premium': min_premium
+        }
+    }
+
+
+def baseline_select_options(config, spot_price, options_chain):
+    """select_options as it was before vectorization, kept as the reference."""
+    min_premium = config['strategy']['min_premium']
+    max_positions = config['strategy']['max_positions']
+
+    valid_options = [opt for opt in options_chain if float(opt['last_price']) >= min_premium]
+    valid_options.sort(key=lambda x: abs(float(x['bid_price']) - float(x['ask_price'])))
+
+    call_options = [opt for opt in valid_options if opt['instrument_type'] == 'CE']
+    put_options = [opt for opt in valid_options if opt['instrument_type'] == 'PE']
+
+    selected_options = []
+    for options in [call_options, put_options]:
+        if options:
+            options.sort(key=lambda x: abs(float(x['strike']) - spot_price))
+            selected_options.extend(options[:max_positions // 2])
+
+    return selected_options[:max_positions]
+
+
+def random_chain(rng, size):
+    # Coarse strikes and spreads so distance and spread ties are common
+    return [
+        {
+            'symbol': f"OPT{k}",
+            'instrument_type': rng.choice(('CE', 'PE')),
+            'strike': rng.randrange(80, 121, 5),
+            'last_price': rng.uniform(20, 120),
+            'bid_price': 10.0,
+            'ask_price': 10.0 + rng.choice((0.5, 1.0, 1.5)),
+            'expiry': '2024-01-31'
+        }
+        for k in range(size)
+    ]
+
+
+@pytest.mark.parametrize('max_positions', [1, 2, 4, 7])
+def test_select_options_matches_baseline(max_positions):
+    rng = random.Random(max_positions)
+    config = make_config(max_positions=max_positions)
+    strategy = DeltaNeutralStrategy(config)
+
+    for size in (0, 1, 5, 40):
+        chain = random_chain(rng, size)
+        expected = baseline_select_options(config, 100.0, chain)
+        assert [o['symbol'] for o in strategy.select_options(100.0, chain)] == [o['symbol'] for o in expected]
+
+
+def make_position(symbol, quantity, delta, price=100.0):
+    return Position(symbol=symbol, quantity=quantity, entry_price=price, current_price=price,
+                    delta=delta, option_type='CE' if delta > 0 else 'PE', strike_price=100, expiry='')
+
+
+def test_process_tick_flags_exits_and_sizes_adjustments_without_them():
+    strategy = DeltaNeutralStrategy(make_config())
+    strategy.portfolio.add_position(make_position('A', 10, 0.5))
+    strategy.portfolio.add_position(make_position('B', 1, -0.5))
+
+    # A hits its profit target; only B's delta is left to hedge
+    exits, adjustments = strategy.process_tick({
+        'A': {'last_price': 200.0, 'delta': 0.5},
+        'B': {'last_price': 100.0, 'delta': -0.5}
+    })
+
+    assert [(s.symbol, s.action, s.quantity, s.reason) for s in exits] == [('A', 'SELL', 10, 'target_hit')]
+    assert adjustments == [{'action': 'BUY', 'option_type': 'CE', 'target_delta': 0.5}]
+
+
+def test_process_tick_flags_zero_cost_position_for_nothing():
+    strategy = DeltaNeutralStrategy(make_config())
+    strategy.portfolio.add_position(make_position('A', 1, 0.0, price=0.0))
+
+    exits, _ = strategy.process_tick({'A': {'last_price': 5.0, 'delta': 0.0}})
+    assert exits == []
+
+
+def test_get_adjustment_signals_picks_closest_strike_and_sizes_by_delta():
+    strategy = DeltaNeutralStrategy(make_config())
+    chain = [
+        {'symbol': 'FAR', 'instrument_type': 'PE', 'strike': 90, 'underlying_price': 100,
+         'delta': -0.5, 'bid_price': 1.0, 'ask_price': 1.1},
+        {'symbol': 'ATM', 'instrument_type': 'PE', 'strike': 100, 'underlying_price': 100,
+         'delta': -0.5, 'bid_price': 1.0, 'ask_price': 1.1},
+        {'symbol': 'CALL', 'instrument_type': 'CE', 'strike': 100, 'underlying_price': 100,
+         'delta': 0.5, 'bid_price': 1.0, 'ask_price': 1.1},
+    ]
+
+    signals = strategy.get_adjustment_signals(
+        [{'action': 'BUY', 'option_type': 'PE', 'target_delta': -4.5}], chain
+    )
+
+    assert [(s.symbol, s.action, s.quantity, s.reason) for s in signals] == [('ATM', 'BUY', 9, 'delta_adjustment')]
+
+
+def test_get_adjustment_signals_skips_types_without_delta():
+    strategy = DeltaNeutralStrategy(make_config())
+    chain = [{'symbol': 'X', 'instrument_type': 'CE', 'strike': 100, 'delta': 0}]
+
+    assert strategy.get_adjustment_signals([{'action': 'BUY', 'option_type': 'CE', 'target_delta': 1.0}], chain) == []
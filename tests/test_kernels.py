@@ -0,0 +1,51 @@
+import numpy as np
+
+from strategy.kernels import (
+    ADJUST_BUY_CE, ADJUST_BUY_PE, ADJUST_NONE, EXIT_NONE, EXIT_STOP_LOSS, EXIT_TARGET,
+    apply_fill, check_adjustment, position_sizes, update_and_signal
+)
+
+
+def test_update_and_signal_applies_updates_and_flags_exits():
+    current_price = np.array([100.0, 100.0, 100.0, 0.0])
+    entry_price = np.array([100.0, 100.0, 100.0, 0.0])
+    delta = np.array([0.5, -0.5, 0.2, 0.1])
+    quantity = np.array([2, 1, 1, 3], dtype=np.int64)
+    exit_codes = np.zeros(4, dtype=np.int8)
+
+    total_delta = update_and_signal(
+        current_price, entry_price, delta, quantity,
+        np.array([0, 1, 3], dtype=np.int64),
+        np.array([110.0, 90.0, 5.0]),
+        np.array([0.6, -0.4, 0.1]),
+        0.05, 0.05, exit_codes
+    )
+
+    assert current_price.tolist() == [110.0, 90.0, 100.0, 5.0]
+    assert delta.tolist() == [0.6, -0.4, 0.2, 0.1]
+    # Row 3 has no entry cost, so its P&L percentage is 0 rather than inf/NaN
+    assert exit_codes.tolist() == [EXIT_TARGET, EXIT_STOP_LOSS, EXIT_NONE, EXIT_NONE]
+    assert np.isclose(total_delta, 0.6 * 2 - 0.4 + 0.2 + 0.1 * 3)
+
+
+def test_check_adjustment_codes():
+    delta = np.array([0.5, -0.2])
+    quantity = np.array([2, 1], dtype=np.int64)
+
+    assert check_adjustment(delta, quantity, 0.0, 0.1) == (ADJUST_BUY_PE, 0.8)
+    assert check_adjustment(delta, quantity, 1.6, 0.1)[0] == ADJUST_BUY_CE
+    assert check_adjustment(delta, quantity, 0.8, 0.1)[0] == ADJUST_NONE
+
+
+def test_position_sizes_has_minimum_of_one():
+    assert position_sizes(np.array([10.0, 1000.0, 3000.0]), 2000.0, 0.5).tolist() == [100, 1, 1]
+
+
+def test_apply_fill_averages_buys_and_reduces_on_sells():
+    quantity = np.array([2], dtype=np.int64)
+    entry_price = np.array([100.0])
+
+    assert apply_fill(quantity, entry_price, 0, 2, 110.0) == 4
+    assert entry_price[0] == 105.0
+    assert apply_fill(quantity, entry_price, 0, -3, 120.0) == 1
+    assert entry_price[0] == 105.0
@@ -0,0 +1,119 @@
+import numpy as np
+import orjson
+import pytest
+
+from utils.monitoring import PerformanceMonitor, dump_to_json
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    monitor = PerformanceMonitor(output_dir=str(tmp_path))
+    yield monitor
+    monitor.close()
+
+
+def reference_returns(pnl):
+    """Step returns of a P&L series, skipping returns off a zero P&L."""
+    pnl = np.asarray(pnl, dtype=np.float64)
+    prev, cur = pnl[:-1], pnl[1:]
+    valid = prev != 0
+    return (cur[valid] - prev[valid]) / prev[valid]
+
+
+def test_merged_returns_match_one_shot_statistics(monitor):
+    rng = np.random.default_rng(7)
+    pnl = 1000 + np.cumsum(rng.normal(0, 10, 500))
+    pnl[[50, 51, 300]] = 0.0
+
+    # Mix single updates with bulk blocks of different sizes
+    for value in pnl[:10]:
+        monitor.record_portfolio_update({'total_pnl': value, 'portfolio_value': 0, 'total_delta': 0})
+    start = 10
+    for size in (1, 37, 200, 252):
+        block = pnl[start:start + size]
+        timestamps = np.arange(start, start + len(block)).astype('datetime64[s]')
+        monitor.record_portfolio_bulk(timestamps, block, np.zeros(len(block)), np.zeros(len(block)))
+        start += size
+
+    returns = reference_returns(pnl)
+    assert monitor._ret_n == len(returns)
+    assert monitor._ret_mean == pytest.approx(returns.mean())
+    assert monitor._ret_m2 == pytest.approx(np.square(returns - returns.mean()).sum())
+    assert np.array_equal(monitor.series('pnl'), pnl)
+
+
+def test_report_uses_running_totals(monitor):
+    for pnl in (10, -5, 0, 3):
+        monitor.record_trade({'symbol': 'A', 'pnl': pnl})
+    for total_pnl, delta in ((100, 1.0), (120, 3.0), (90, 2.0)):
+        monitor.record_portfolio_update({'total_pnl': total_pnl, 'portfolio_value': 0, 'total_delta': delta})
+
+    report = monitor.generate_report()
+
+    assert (report['total_trades'], report['winning_trades'], report['losing_trades']) == (4, 2, 1)
+    assert report['total_pnl'] == 90
+    assert report['average_delta_exposure'] == pytest.approx(2.0)
+    assert report['max_drawdown'] == pytest.approx(25.0)
+
+
+def test_max_drawdown_matches_reference_on_long_series():
+    rng = np.random.default_rng(3)
+    values = 100 + np.cumsum(rng.normal(0, 1, 5000))
+
+    peak = np.maximum.accumulate(values)
+    expected = float(((peak - values) / peak).max()) * 100
+    assert PerformanceMonitor._calculate_max_drawdown(values) == pytest.approx(expected)
+
+
+def test_json_streams_round_trip(tmp_path):
+    monitor = PerformanceMonitor(output_dir=str(tmp_path))
+    monitor.record_trade({'symbol': 'A', 'pnl': np.float64(1.5), 1: 'int key'})
+    monitor.record_portfolio_update({'total_pnl': 10.0, 'portfolio_value': 200.0, 'total_delta': 0.25})
+    monitor.close()
+
+    streams = {
+        stream: [orjson.loads(line) for line in path.read_bytes().splitlines()]
+        for stream, path in monitor._paths.items()
+    }
+
+    assert [{k: v for k, v in r.items() if k != 'timestamp'} for r in streams['trades']] == [
+        {'symbol': 'A', 'pnl': 1.5, '1': 'int key'}
+    ]
+    assert [r['value'] for r in streams['pnl']] == [10.0]
+    assert [r['value'] for r in streams['portfolio_value']] == [200.0]
+    assert [r['value'] for r in streams['delta_exposure']] == [0.25]
+    assert streams['pnl'][0]['timestamp'].endswith('+00:00')
+    assert not list(tmp_path.glob('*.part'))
+
+    snapshot = orjson.loads(monitor.snapshot().read_bytes())
+    assert snapshot['pnl'] == streams['pnl']
+
+
+def test_preallocated_streams_are_trimmed_on_close(tmp_path):
+    monitor = PerformanceMonitor(output_dir=str(tmp_path), preallocate_bytes=1 << 16)
+    assert list(tmp_path.glob('*.part'))
+    monitor.record_trade({'symbol': 'A'})
+    monitor.close()
+
+    assert not list(tmp_path.glob('*.part'))
+    lines = monitor._paths['trades'].read_bytes().splitlines()
+    assert [orjson.loads(line)['symbol'] for line in lines] == ['A']
+
+
+def test_msgpack_streams_convert_to_json(tmp_path):
+    pytest.importorskip('msgspec')
+    monitor = PerformanceMonitor(output_dir=str(tmp_path), codec='msgpack')
+    monitor.record_trade({'symbol': 'A', 'pnl': np.float64(2.0)})
+    monitor.record_trade({'symbol': 'B', 'pnl': -1})
+    monitor.close()
+
+    output = dump_to_json(str(monitor._paths['trades']))
+    records = [orjson.loads(line) for line in output.read_bytes().splitlines()]
+
+    assert [(r['symbol'], r['pnl']) for r in records] == [('A', 2.0), ('B', -1)]
+    assert all(isinstance(r['timestamp'], str) for r in records)
+
+
+def test_unknown_codec_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        PerformanceMonitor(output_dir=str(tmp_path), codec='xml')
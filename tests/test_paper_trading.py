@@ -0,0 +1,46 @@
+from strategy.delta_neutral import DeltaNeutralStrategy
+from trading.paper_trading import PaperTradingExecutor
+
+from test_delta_neutral import make_config
+
+
+def option(option_type, strike, delta):
+    return {
+        'instrument_type': option_type, 'strike': strike, 'expiry': '2024-01-31',
+        'underlying_price': 100.0, 'last_price': 60.0, 'bid_price': 59.5, 'ask_price': 60.5,
+        'volume': 100, 'oi': 10, 'delta': delta
+    }
+
+
+def test_options_chain_lists_options_with_market_data():
+    executor = PaperTradingExecutor(DeltaNeutralStrategy(make_config()))
+    executor.simulate_market_update({
+        'C100': option('CE', 100, 0.5),
+        'P100': option('PE', 100, -0.5),
+        'FUT': {'instrument_type': 'FUT', 'last_price': 100.0}
+    })
+
+    chain = executor.get_options_chain()
+
+    assert sorted(o['symbol'] for o in chain) == ['C100', 'P100']
+    assert all(o['underlying_price'] == 100.0 for o in chain)
+
+
+def test_cycle_without_options_places_nothing():
+    executor = PaperTradingExecutor(DeltaNeutralStrategy(make_config(target_delta=1.0)))
+
+    executor.monitor_and_execute()
+
+    assert executor.orders == []
+
+
+def test_cycle_enters_and_adjusts_on_the_chain():
+    executor = PaperTradingExecutor(DeltaNeutralStrategy(make_config(max_positions=2, target_delta=1.0)))
+    executor.simulate_market_update({
+        'C100': option('CE', 100, 0.5),
+        'P100': option('PE', 100, -0.5)
+    })
+
+    executor.monitor_and_execute()
+
+    assert [(o.symbol, o.side) for o in executor.orders] == [('C100', 'BUY'), ('P100', 'BUY'), ('C100', 'BUY')]
@@ -0,0 +1,80 @@
+import pytest
+
+from strategy.portfolio import PortfolioManager, Position
+
+
+def make_position(symbol, quantity=1, price=100.0, delta=0.5, option_type='CE'):
+    return Position(
+        symbol=symbol,
+        quantity=quantity,
+        entry_price=price,
+        current_price=price,
+        delta=delta,
+        option_type=option_type,
+        strike_price=100,
+        expiry='2024-01-31'
+    )
+
+
+def assert_consistent(portfolio, expected):
+    """Check every row matches its symbol's expected (quantity, delta) and index_of."""
+    assert len(portfolio) == len(expected)
+    assert sorted(portfolio.symbols) == sorted(expected)
+    for i, symbol in enumerate(portfolio.symbols):
+        assert portfolio.index_of(symbol) == i
+        assert (int(portfolio.quantity[i]), float(portfolio.delta[i])) == expected[symbol]
+
+
+def test_remove_position_swaps_last_row_into_gap():
+    portfolio = PortfolioManager()
+    expected = {}
+    for k in range(5):
+        portfolio.add_position(make_position(f"S{k}", quantity=k + 1, delta=k / 10))
+        expected[f"S{k}"] = (k + 1, k / 10)
+
+    # Middle, first, last and an unknown symbol
+    for symbol in ('S2', 'S0', 'S3', 'MISSING'):
+        portfolio.remove_position(symbol)
+        expected.pop(symbol, None)
+        assert_consistent(portfolio, expected)
+        assert symbol not in portfolio
+
+
+def test_add_position_grows_past_initial_capacity():
+    portfolio = PortfolioManager()
+    count = PortfolioManager.INITIAL_CAPACITY + 3
+    for k in range(count):
+        portfolio.add_position(make_position(f"S{k}", quantity=k + 1, delta=1.0))
+
+    assert_consistent(portfolio, {f"S{k}": (k + 1, 1.0) for k in range(count)})
+    assert portfolio.total_delta == sum(range(1, count + 1))
+
+
+def test_add_existing_position_overwrites_its_row():
+    portfolio = PortfolioManager()
+    portfolio.add_position(make_position('A', quantity=1))
+    portfolio.add_position(make_position('A', quantity=7, delta=-0.3, option_type='PE'))
+
+    assert len(portfolio) == 1
+    assert portfolio.get_position('A') == make_position('A', quantity=7, delta=-0.3, option_type='PE')
+
+
+def test_adjustment_trades_match_with_precomputed_delta():
+    portfolio = PortfolioManager(target_delta=0.0)
+    portfolio.add_position(make_position('A', quantity=3, delta=0.5))
+    portfolio.add_position(make_position('B', quantity=1, delta=-0.2))
+
+    trades = portfolio.get_adjustment_trades(0.1)
+    assert trades == portfolio.get_adjustment_trades(0.1, portfolio.total_delta)
+    assert [(t['action'], t['option_type']) for t in trades] == [('BUY', 'PE')]
+    assert trades[0]['target_delta'] == pytest.approx(-1.3)
+    assert portfolio.get_adjustment_trades(2.0) == []
+
+
+def test_str_counts_positions():
+    portfolio = PortfolioManager()
+    portfolio.add_position(make_position('A'))
+    portfolio.add_position(make_position('B'))
+    portfolio.remove_position('A')
+
+    assert "Total Positions: 1\n" in str(portfolio)